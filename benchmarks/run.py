@@ -0,0 +1,326 @@
+"""Benchmark the hot paths of sqlalchemy-model-factory, against an in-memory SQLite database.
+
+Each benchmark is run at each of the given scales (the number of rows, calls or registered
+factories involved), and the best and mean of several repeats are recorded. The results
+are written as JSON, such that they can be compared between versions (of this library, or
+of SQLAlchemy) to catch regressions.
+
+Usage:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --scales 10 1000 --filter add_result
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Type
+
+import sqlalchemy
+from sqlalchemy import Column, create_engine, ForeignKey, types
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy_model_factory.base import ModelFactory, Namespace
+from sqlalchemy_model_factory.registry import Registry
+from sqlalchemy_model_factory.utils import fluent, for_model
+
+DEFAULT_SCALES = [10, 100, 1_000, 10_000, 100_000]
+
+Base = declarative_base()
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    name = Column(types.Unicode(), nullable=True)
+
+
+class Wide(Base):
+    __tablename__ = "wide"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    a = Column(types.Unicode(), nullable=True)
+    b = Column(types.Unicode(), nullable=True)
+    c = Column(types.Unicode(), nullable=True)
+    d = Column(types.Integer(), nullable=True)
+    e = Column(types.Integer(), nullable=True)
+    f = Column(types.Integer(), nullable=True)
+    g = Column(types.Boolean(), nullable=True)
+    h = Column(types.Boolean(), nullable=True)
+
+
+class Child(Base):
+    __tablename__ = "child"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    parent_id = Column(types.Integer(), ForeignKey("parent.id"), nullable=False)
+    name = Column(types.Unicode(), nullable=True)
+
+    parent = relationship(Parent)
+
+
+def new_registry() -> Registry:
+    registry = Registry()
+
+    @registry.register_at("parent")
+    def new_parent(name=None):
+        return Parent(name=name)
+
+    @registry.register_at("child")
+    def new_child(parent=None, name=None):
+        return Child(parent=parent or Parent(), name=name)
+
+    @registry.register_at("wide")
+    @for_model(Wide)
+    def new_wide(index=0):
+        return dict(a="a", b="b", c="c", d=index, e=index, f=index, g=True, h=False)
+
+    @registry.register_at("parent", name="merged", merge=True)
+    def new_merged_parent(name=None):
+        return Parent(name=name)
+
+    return registry
+
+
+def new_session():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+class Case:
+    """Prepare (untimed) and run (timed) one benchmark at a given scale."""
+
+    # Cases which commit per row become quadratic (each commit expires the whole session),
+    # and so are not run beyond this scale.
+    max_scale: Optional[int] = None
+
+    def __init__(self, scale: int):
+        self.scale = scale
+
+    def setup(self):
+        pass
+
+    def run(self):
+        raise NotImplementedError()
+
+    def teardown(self):
+        pass
+
+
+class RegistryTree(Case):
+    """`Namespace.from_registry` over a registry of `scale` factories."""
+
+    def setup(self):
+        self.registry = Registry()
+        for index in range(self.scale):
+            self.registry.register_at(f"namespace{index % 100}", name=f"new{index}")(
+                new_registry
+            )
+
+    def run(self):
+        # Bump the version, such that the tree is rebuilt rather than served from the cache.
+        self.registry.version += 1
+        Namespace.from_registry(self.registry)
+
+
+class ManagedCase(Case):
+    options: Optional[Dict] = None
+
+    def setup(self):
+        self.session = new_session()
+        self.manager = ModelFactory(new_registry(), self.session, options=self.options)
+        self.mf = self.manager.__enter__()
+
+    def teardown(self):
+        self.manager.__exit__(None, None, None)
+        self.session.close()
+        self.session.get_bind().dispose()
+
+
+class SingleCall(ManagedCase):
+    """`scale` single-row `Namespace.__call__`s."""
+
+    max_scale = 1_000
+
+    def run(self):
+        new = self.mf.parent.new
+        for _ in range(self.scale):
+            new()
+
+
+class AddResultList(ManagedCase):
+    """One `add_result` of a list of `scale` models."""
+
+    merge = False
+
+    def setup(self):
+        super().setup()
+        self.models = [Parent() for _ in range(self.scale)]
+
+    def run(self):
+        self.manager.add_result(self.models, merge=self.merge)
+
+
+class AddResultListMerge(AddResultList):
+    merge = True
+
+
+class AddResultSingles(AddResultList):
+    """`scale` `add_result`s of single models."""
+
+    max_scale = 1_000
+
+    def run(self):
+        for model in self.models:
+            self.manager.add_result(model, merge=self.merge)
+
+
+class AddResultSinglesMerge(AddResultSingles):
+    merge = True
+
+
+class Teardown(ManagedCase):
+    """`remove_managed_data` of `scale` produced models (and their parents)."""
+
+    def setup(self):
+        super().setup()
+        self.mf.child.new(count_=self.scale, refresh_="none")
+
+    def run(self):
+        self.manager.remove_managed_data()
+
+
+class WideCall(ManagedCase):
+    """One `for_model` call of a wide model with `count_=scale`."""
+
+    core = False
+
+    def run(self):
+        self.mf.wide.new(count_=self.scale, core_=self.core)
+
+
+class WideCallCore(WideCall):
+    """As `WideCall`, but inserted directly (`core_=True`), without model instances."""
+
+    core = True
+
+
+class FluentBind(Case):
+    """`scale` fluent call chains, finalized with `bind()`."""
+
+    def setup(self):
+        @fluent
+        def new_child(parent, name=None, number=0):
+            return (parent, name, number)
+
+        self.factory = new_child
+
+    def run(self):
+        factory = self.factory
+        for index in range(self.scale):
+            factory.parent(None).name("name").number(index).bind()
+
+
+class ForModelCoercion(Case):
+    """`scale` calls of a `for_model` coerced factory."""
+
+    def setup(self):
+        @for_model(Parent)
+        def new_parent(name=None):
+            return {"name": name}
+
+        self.factory = new_parent.for_model
+
+    def run(self):
+        factory = self.factory
+        for _ in range(self.scale):
+            factory(name="name")
+
+
+BENCHMARKS: Dict[str, Type[Case]] = {
+    "namespace.from_registry": RegistryTree,
+    "namespace.call": SingleCall,
+    "add_result.list": AddResultList,
+    "add_result.list.merge": AddResultListMerge,
+    "add_result.singles": AddResultSingles,
+    "add_result.singles.merge": AddResultSinglesMerge,
+    "remove_managed_data": Teardown,
+    "for_model.wide": WideCall,
+    "for_model.wide.core": WideCallCore,
+    "fluent.bind": FluentBind,
+    "for_model": ForModelCoercion,
+}
+
+
+def measure(factory: Type[Case], scale: int, repeat: int) -> Dict:
+    timings: List[float] = []
+    for _ in range(repeat):
+        case = factory(scale)
+        case.setup()
+        try:
+            start = time.perf_counter()
+            case.run()
+            timings.append(time.perf_counter() - start)
+        finally:
+            case.teardown()
+
+    best = min(timings)
+    return {
+        "scale": scale,
+        "repeat": repeat,
+        "best": best,
+        "mean": statistics.mean(timings),
+        "per_item": best / scale,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks whose name contains this."
+    )
+    parser.add_argument(
+        "--output", help="The path to write the JSON results to (default: stdout)."
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, factory in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        for scale in args.scales:
+            if factory.max_scale is not None and scale > factory.max_scale:
+                continue
+
+            result = {"name": name, **measure(factory, scale, args.repeat)}
+            results.append(result)
+            print(
+                f"{name:<28} {scale:>8} {result['best']:>10.4f}s "
+                f"{result['per_item'] * 1e6:>10.2f}us/item",
+                file=sys.stderr,
+            )
+
+    report = {
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,11 @@
+from sqlalchemy_model_factory.asyncio import AsyncModelFactory
 from sqlalchemy_model_factory.base import ModelFactory
 from sqlalchemy_model_factory.declarative import declarative, factory
 from sqlalchemy_model_factory.registry import register_at, Registry, registry
 from sqlalchemy_model_factory.utils import autoincrement, fluent, for_model
 
 __all__ = [
+    "AsyncModelFactory",
     "autoincrement",
     "declarative",
     "factory",
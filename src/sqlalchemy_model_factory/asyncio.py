@@ -0,0 +1,112 @@
+"""Support for producing models through SQLAlchemy's asyncio extension."""
+import asyncio
+from typing import Optional
+
+from sqlalchemy_model_factory.base import ModelFactory, Namespace
+from sqlalchemy_model_factory.registry import Registry
+
+
+class AsyncModelFactory:
+    """Drive factories through an `AsyncSession`.
+
+    Calling a factory returns an awaitable, which performs the flush, commit and refresh
+    asynchronously. Internally, this wraps a `ModelFactory` over the `AsyncSession`'s
+    underlying `sync_session`, through `AsyncSession.run_sync`, such that the behavior (and
+    options) of the two are identical.
+
+    *Note* an `AsyncSession` cannot be used concurrently, so factory calls made concurrently
+    (i.e. through `asyncio.gather`) are performed one at a time. Additionally, as with any
+    `AsyncSession`, attributes expired by a commit cannot be lazily reloaded, so the session
+    should generally be created with `expire_on_commit=False`.
+
+    Examples:
+        >>> async def test_foo(async_session):
+        ...     async with AsyncModelFactory(registry, async_session) as mf:
+        ...         foo = await mf.foo.new()
+    """
+
+    def __init__(self, registry: Registry, session, options=None):
+        self.registry = registry
+        self.session = session
+        self.manager = ModelFactory(registry, session.sync_session, options=options)
+
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        self._lock = asyncio.Lock()
+        await self.session.run_sync(lambda _: self.manager.__enter__())
+        return Namespace.from_registry(self.registry, manager=self)
+
+    async def __aexit__(self, *exc_info):
+        await self.session.run_sync(lambda _: self.manager.__exit__(*exc_info))
+        return False
+
+    @property
+    def instrumented(self) -> bool:
+        return self.manager.instrumented
+
+    async def call(
+        self, plan, produce, args, kwargs, commit, merge, refresh, core=False
+    ):
+        """Call `produce` and add its result, through the synchronous `ModelFactory.call`."""
+        async with self._get_lock():
+            return await self.session.run_sync(
+                lambda _: self.manager.call(
+                    plan, produce, args, kwargs, commit, merge, refresh, core=core
+                )
+            )
+
+    async def add_result(self, result, commit=True, merge=False, refresh=None):
+        async with self._get_lock():
+            return await self.session.run_sync(
+                lambda _: self.manager.add_result(
+                    result, commit=commit, merge=merge, refresh=refresh
+                )
+            )
+
+    async def insert_mappings(self, model, mappings, commit=True):
+        async with self._get_lock():
+            return await self.session.run_sync(
+                lambda _: self.manager.insert_mappings(model, mappings, commit=commit)
+            )
+
+    def batch(self):
+        """Defer the flush/commit of factory results until the end of an `async with` block."""
+        return _AsyncBatch(self)
+
+    async def flush(self):
+        """Flush, commit and refresh the results of any factory calls deferred by `batch`."""
+        async with self._get_lock():
+            await self.session.run_sync(lambda _: self.manager.flush())
+
+    def created(self, model_cls=None):
+        return self.manager.created(model_cls)
+
+    def created_count(self, model_cls=None):
+        return self.manager.created_count(model_cls)
+
+    def stats(self):
+        return self.manager.stats()
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+
+class _AsyncBatch:
+    def __init__(self, factory: AsyncModelFactory):
+        self.factory = factory
+        self.batch = factory.manager.batch()
+
+    async def __aenter__(self):
+        self.batch.__enter__()
+        return self.factory
+
+    async def __aexit__(self, *exc_info):
+        # Exiting the outermost batch flushes, which must occur within `run_sync`.
+        async with self.factory._get_lock():
+            await self.factory.session.run_sync(
+                lambda _: self.batch.__exit__(*exc_info)
+            )
+        return False
@@ -1,93 +1,593 @@
-from typing import Any, Dict, Optional, Set
+import contextlib
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy_model_factory.registry import Method, Registry
+from sqlalchemy import event, inspect
+from sqlalchemy_model_factory.cleanup import get_cleanup, NoCleanup
+from sqlalchemy_model_factory.profiling import FactoryStats, Profiler
+from sqlalchemy_model_factory.registry import CallPlan, Method, Registry
+from sqlalchemy_model_factory.sql import (
+    chunked,
+    column_keys,
+    insert_identities,
+    max_parameters,
+    primary_key_in,
+)
+from sqlalchemy_model_factory.tracking import get_tracker
+from sqlalchemy_model_factory.utils import (
+    autoincrement_positions,
+    restore_autoincrement,
+)
 
 _ITERABLES = (list, tuple, set)
 
+_REFRESH_STRATEGIES = ("eager", "expire", "batch", "returning", "none")
+
 
 class Options:
-    def __init__(self, commit=True, cleanup=True):
+    def __init__(
+        self,
+        commit=True,
+        cleanup=True,
+        refresh="eager",
+        isolate_calls=False,
+        track="object",
+        expunge=False,
+        profile=False,
+        profile_memory=False,
+        reset_autoincrement=None,
+    ):
         self.commit = commit
         self.cleanup = cleanup
+        self.refresh = refresh
+        self.isolate_calls = isolate_calls
+        self.track = track
+        self.expunge = expunge
+        self.profile = profile
+        self.profile_memory = profile_memory
+        self.reset_autoincrement = reset_autoincrement
 
 
 class ModelFactory:
     def __init__(self, registry: Registry, session, options=None):
         self.registry = registry
-        self.new_models: Set = set()
         self.session = session
 
         self.options = Options(**options or {})
+        self.cleanup = get_cleanup(self.options.cleanup)
+        self.new_models = get_tracker(self.options.track)
+        self.profiler = None
+        if self.options.profile or self.options.profile_memory:
+            self.profiler = Profiler(memory=self.options.profile_memory)
+        self.hooks = registry.hooks
+
+        self._path: Optional[str] = None
+        self._batch_depth = 0
+        self._tracking = 0
+        self._pending: List[Tuple[Any, Optional[str]]] = []
+        self._flushing: List = []
+        self._flushed: List = []
+        self._streaming = 0
+        self._autoincrement_positions: Optional[Dict] = None
 
     def __enter__(self):
+        event.listen(self.session, "before_flush", self._capture_pending)
+        event.listen(self.session, "after_flush_postexec", self._track_flushed)
+        self._autoincrement_positions = autoincrement_positions()
+        self.cleanup.start(self)
+        if self.profiler is not None:
+            self.profiler.start(self.session)
         return Namespace.from_registry(self.registry, manager=self)
 
     def __exit__(self, *_):
-        self.remove_managed_data()
+        try:
+            self.remove_managed_data()
+
+            # Unless the produced data is left in place, reusing the values produced inside
+            # this context cannot collide.
+            reset = self.options.reset_autoincrement
+            if reset is None:
+                reset = not isinstance(self.cleanup, NoCleanup)
+            if reset and self._autoincrement_positions is not None:
+                restore_autoincrement(self._autoincrement_positions)
+            self._autoincrement_positions = None
+        finally:
+            event.remove(self.session, "before_flush", self._capture_pending)
+            event.remove(self.session, "after_flush_postexec", self._track_flushed)
+            if self.profiler is not None:
+                self.profiler.stop(self.session)
         return False
 
+    def _capture_pending(self, session, flush_context, instances):
+        # Only models flushed as a result of factory calls are tracked, which includes
+        # flushes (auto or otherwise) which occur within a `batch`.
+        if self._tracking or self._batch_depth:
+            self._flushing = list(session.new)
+        else:
+            self._flushing = []
+
+    def _track_flushed(self, session, flush_context):
+        # Models are only tracked once flushed, at which point their identity is known.
+        flushed, self._flushing = self._flushing, []
+        if self._streaming:
+            # Streamed models are only recorded by identity, so that they can be released.
+            for model in flushed:
+                state = inspect(model)
+                if state.identity is not None:
+                    self.new_models.add_identity(state.class_, state.identity)
+        else:
+            self.new_models.add_all(flushed)
+
+        if self._expunging():
+            self._flushed.extend(flushed)
+
+    @property
+    def instrumented(self) -> bool:
+        """Whether factory calls should be routed through `call`, to be profiled or hooked."""
+        return self.profiler is not None or self.hooks.active
+
+    def _span(self, name: str, **fields):
+        if not self.hooks.active:
+            return _NO_SPAN
+        return self.hooks.span(name, path=self._path, **fields)
+
     def remove_managed_data(self):
-        if not self.options.cleanup:
+        self._pending.clear()
+
+        with self._span("cleanup", size=len(self.new_models)):
+            if self.profiler is None:
+                self.cleanup.finish(self)
+                return
+
+            with self.profiler.track(self.profiler.cleanup):
+                self.cleanup.finish(self)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer the flush/commit of factory results until the end of the block.
+
+        Factory calls made inside the block add their models to the session (and
+        track them) as usual, but the models are only flushed, committed and refreshed
+        once, upon exiting the (outermost) block or calling `flush`.
+
+        *Note* the session may still autoflush the pending models earlier, for example
+        if a query is performed inside the block.
+        """
+        outermost = not self._batch_depth
+        before = {id(model) for model in self.session.new} if outermost else set()
+
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if outermost:
+                self._pending.clear()
+
+                # Otherwise the queued models would be flushed and committed by the next
+                # factory call. Models which were already (auto)flushed remain tracked.
+                for model in list(self.session.new):
+                    if id(model) not in before:
+                        self.session.expunge(model)
+            raise
+        finally:
+            self._batch_depth -= 1
+
+        if self._batch_depth:
             return
 
-        # Events inside the context manager could have left pending state.
-        self.session.rollback()
+        if self.profiler is None:
+            self.flush()
+            return
 
-        if getattr(self.session, "autocommit", None):
-            self.session.begin()
+        with self.profiler.track(self.profiler.factory("<batch>")):
+            self.flush()
 
-        while self.session.identity_map:
-            model = next(iter(self.session.identity_map.values()))
-            self.session.delete(model)
-            self.session.flush()
+    def flush(self):
+        """Flush, commit and refresh the results of any factory calls deferred by `batch`."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
 
-        self.new_models.clear()
+        self._tracking += 1
+        try:
+            with self._span("flush", size=len(pending)):
+                self.session.flush()
+        finally:
+            self._tracking -= 1
 
-        if self.options.commit:
-            self.session.commit()
+        committed = [(result, refresh) for result, refresh in pending if refresh]
+        if committed:
+            with self._span("commit"):
+                self._commit(
+                    expire=any(refresh != "returning" for _, refresh in committed)
+                )
 
-    def add_result(self, result, commit=True, merge=False):
-        # The state of the session is unknown at this point. Ensure it's empty.
-        self.session.rollback()
+            items_by_refresh: Dict[str, List] = {}
+            for result, refresh in committed:
+                items_by_refresh.setdefault(refresh, []).extend(_iter_models(result))
 
-        # When the session is autocommit, it is expected that you start the transaction manually.
-        if getattr(self.session, "autocommit", None):
-            self.session.begin()
+            size = sum(map(len, items_by_refresh.values()))
+            with self._span("refresh", size=size):
+                for refresh, items in items_by_refresh.items():
+                    getattr(self, f"_refresh_{refresh}")(items)
+
+                    if self.profiler is not None and refresh not in (
+                        "returning",
+                        "none",
+                    ):
+                        self.profiler.count_refreshes(len(items))
+
+        if self._expunging():
+            self._expunge(pending)
+
+    def _expunging(self):
+        return self.options.expunge or self._streaming
+
+    def _expunge(self, pending):
+        flushed, self._flushed = self._flushed, []
+        for result, _ in pending:
+            flushed.extend(_iter_models(result))
+
+        for model in flushed:
+            if model in self.session:
+                self.session.expunge(model)
+
+    def call(
+        self,
+        plan: CallPlan,
+        produce: Callable,
+        args,
+        kwargs,
+        commit,
+        merge,
+        refresh,
+        core=False,
+        manager=None,
+    ):
+        """Call `produce` and add its result, recording the call with the profiler and hooks.
+
+        Used by `Namespace` in place of calling the factory and `add_result` (or with `core`,
+        `insert_mappings`) directly, only while the factory is `instrumented`. Managers which
+        wrap this one (i.e. `ParallelModelFactory`) supply themselves as the `manager` through
+        which the result is added.
+        """
+        manager = manager or self
+        if core:
+
+            def add(result):
+                return manager.insert_mappings(plan.model, result, commit=commit)
 
-        if merge:
-            if isinstance(result, _ITERABLES):
-                items = []
-                for item in result:
-                    items.append(self.session.merge(item))
-                result = items
-            else:
-                result = self.session.merge(result)
         else:
-            if isinstance(result, _ITERABLES):
-                for item in result:
-                    self.session.add(item)
-            else:
-                self.session.add(result)
 
-        self.new_models = self.new_models.union(self.session.new)
+            def add(result):
+                return manager.add_result(
+                    result, commit=commit, merge=merge, refresh=refresh
+                )
 
-        self.session.flush()
-        if commit:
-            # Again, we cannot predict what's happening elsewhere, so we should try to keep models
-            # appear to return as they would if freshly queried from the database.
-            if self.options.commit:
-                self.session.commit()
-            else:
-                self.session.flush()
+        path = ".".join(plan.path) or getattr(plan.target, "__qualname__", "<unknown>")
+
+        previous, self._path = self._path, path
+        try:
+            if self.profiler is None:
+                return self._call(produce, args, kwargs, add)
 
-            if isinstance(result, _ITERABLES):
-                for item in result:
-                    self.session.refresh(item)
+            with self.profiler.track(self.profiler.factory(path)) as stats:
+                start = time.perf_counter()
+                return self._call(produce, args, kwargs, add, stats, start)
+        finally:
+            self._path = previous
+
+    def _call(self, produce, args, kwargs, add, stats=None, start=None):
+        with self._span("call", args=args, kwargs=kwargs) as span:
+            result = produce()
+            if span is not None:
+                span.result = result
+                span.size = _count_models(result)
+
+        if stats is not None:
+            stats.user_time += time.perf_counter() - start
+
+        return add(result)
+
+    def add_result(self, result, commit=True, merge=False, refresh=None):
+        if not self.hooks.active:
+            return self._add_result(result, commit, merge, refresh)
+
+        with self._span("add_result", size=_count_models(result)) as span:
+            result = self._add_result(result, commit, merge, refresh)
+            span.result = result
+        return result
+
+    def _add_result(self, result, commit, merge, refresh):
+        refresh = self._refresh_strategy(refresh)
+
+        if not self._batch_depth:
+            self._prepare_transaction()
+
+        self._tracking += 1
+        try:
+            if merge:
+                result = self._merge(result)
             else:
-                self.session.refresh(result)
+                self.session.add_all(list(_iter_models(result)))
+
+            # Again, we cannot predict what's happening elsewhere, so we should try to keep models
+            # appear to return as they would if freshly queried from the database.
+            self._pending.append((result, refresh if commit else None))
+            if not self._batch_depth:
+                self.flush()
+        finally:
+            self._tracking -= 1
 
         return result
 
+    def insert_mappings(self, model, mappings, commit=True):
+        """Insert `mappings` of `model` attribute values directly into its table.
+
+        No model instances are constructed (nor are ORM events or validators applied), and so
+        this skips the cost of their instrumentation and of the unit of work. The rows are
+        inserted with a single executemany (per distinct set of keys), returning their primary
+        keys, which are tracked for cleanup and returned in place of models.
+
+        `mappings` is either a single mapping (returning a single identity), or a
+        (potentially nested) list of mappings.
+
+        Inside a `batch`, the rows are inserted immediately, but committed with the batch.
+        """
+        single = not isinstance(mappings, _ITERABLES)
+        rows = [mappings] if single else list(_iter_models(mappings))
+
+        mapper = inspect(model)
+        if len(mapper.tables) != 1:
+            raise ValueError(
+                f"{model.__name__} spans multiple tables, and so cannot be inserted directly."
+            )
+        table = mapper.local_table
+        discriminator = _discriminator(mapper)
+
+        if not self._batch_depth:
+            self._prepare_transaction()
+
+        # Executemany requires every row to supply the same keys, so rows are grouped by them.
+        indexes_by_keys: Dict[Tuple, List[int]] = {}
+        for index, row in enumerate(rows):
+            indexes_by_keys.setdefault(tuple(row), []).append(index)
+
+        identities: List = [None] * len(rows)
+        with self._span("flush", size=len(rows)):
+            for keys, indexes in indexes_by_keys.items():
+                columns = column_keys(mapper, keys)
+                group = [
+                    {columns[key]: value for key, value in rows[index].items()}
+                    for index in indexes
+                ]
+                if discriminator is not None:
+                    key, identity = discriminator
+                    for row in group:
+                        row.setdefault(key, identity)
+                for index, identity in zip(
+                    indexes, insert_identities(self.session, table, group)
+                ):
+                    identities[index] = identity
+                    self.new_models.add_identity(model, identity)
+
+        if self._batch_depth:
+            # Nothing is left to flush, but the batch should still commit the rows.
+            self._pending.append(([], "none" if commit else None))
+        elif commit:
+            with self._span("commit"):
+                self._commit(expire=False)
+
+        return identities[0] if single else identities
+
+    def stream(
+        self,
+        produce: Callable,
+        count: int,
+        chunk_size: int = 5000,
+        pks=False,
+        commit=True,
+        merge=False,
+        refresh=None,
+    ):
+        """Produce `count` results of `produce()`, yielding them one chunk at a time.
+
+        Each chunk is flushed, committed and expunged from the session before the
+        next chunk is produced, such that only one chunk of models is held at once.
+        Streamed models are tracked by their primary key identity (regardless of the
+        `track` option), and so appear as such in `created`.
+
+        Models are yielded detached, or when `pks` is set, as their primary key identities.
+        Unless otherwise specified, the "returning" refresh strategy is used, such that
+        the yielded models retain the state loaded upon their insertion.
+        """
+        if self._batch_depth:
+            raise RuntimeError("`stream` cannot be used inside of a `batch`.")
+
+        refresh = self._refresh_strategy(refresh or "returning")
+        chunk_size = max(chunk_size, 1)
+        return self._stream(produce, count, chunk_size, pks, commit, merge, refresh)
+
+    def _stream(self, produce, count, chunk_size, pks, commit, merge, refresh):
+        remaining = count
+        while remaining > 0:
+            size = min(remaining, chunk_size)
+            remaining -= size
+
+            result = [produce() for _ in range(size)]
+
+            self._streaming += 1
+            try:
+                result = self.add_result(
+                    result, commit=commit, merge=merge, refresh=refresh
+                )
+            finally:
+                self._streaming -= 1
+
+            if pks:
+                result = [inspect(model).identity for model in result]
+            yield from result
+
+    def parallel(self, workers: int, chunk_size: Optional[int] = None):
+        """Produce a `Namespace` whose factory results are inserted by a pool of threads.
+
+        See `ParallelModelFactory`.
+        """
+        from sqlalchemy_model_factory.parallel import ParallelModelFactory
+
+        manager = ParallelModelFactory(self, workers, chunk_size=chunk_size)
+        return Namespace.from_registry(self.registry, manager=manager)
+
+    def created(self, model_cls=None):
+        """Return the models produced by factories, optionally filtered by model class."""
+        return self.new_models.created(model_cls)
+
+    def stats(self) -> Dict[str, FactoryStats]:
+        """Return the `FactoryStats` recorded per factory path, when the `profile` option is set."""
+        if self.profiler is None:
+            raise RuntimeError(
+                "Stats are only recorded when the `profile` (or `profile_memory`) option is set."
+            )
+        return dict(self.profiler.stats)
+
+    def created_count(self, model_cls=None):
+        """Return the number of models produced by factories, optionally filtered by model class."""
+        return self.new_models.count(model_cls)
+
+    def _prepare_transaction(self):
+        # A failed flush elsewhere leaves the transaction unusable until it's rolled back.
+        # Otherwise the transaction is left alone, unless each call is to be isolated.
+        if self.options.isolate_calls or not self.session.is_active:
+            self.session.rollback()
+
+        # When the session is autocommit, it is expected that you start the transaction manually.
+        if getattr(self.session, "autocommit", None) and not _in_transaction(
+            self.session
+        ):
+            self.session.begin()
+
+    def _refresh_strategy(self, refresh):
+        refresh = refresh or self.options.refresh
+        if refresh not in _REFRESH_STRATEGIES:
+            raise ValueError(
+                f"Unrecognized refresh option {refresh!r}, expected one of: {', '.join(_REFRESH_STRATEGIES)}"
+            )
+        return refresh
+
+    def _commit(self, expire=True):
+        if not self.options.commit:
+            self.session.flush()
+            return
+
+        if expire:
+            self.session.commit()
+            return
+
+        # Values produced by the INSERT (primary keys, and server defaults when the mapper
+        # fetches them eagerly through RETURNING) are already loaded. Avoid the commit
+        # expiring them, so that nothing is reloaded.
+        expire_on_commit = self.session.expire_on_commit
+        self.session.expire_on_commit = False
+        try:
+            self.session.commit()
+        finally:
+            self.session.expire_on_commit = expire_on_commit
+
+    def _refresh_eager(self, items, session=None):
+        session = session or self.session
+        for item in items:
+            session.refresh(item)
+
+    def _refresh_expire(self, items):
+        for item in items:
+            self.session.expire(item)
+
+    def _refresh_batch(self, items, session=None):
+        session = session or self.session
+        identities_by_mapper: Dict = {}
+        for item in items:
+            state = inspect(item)
+            if state.identity is not None:
+                identities_by_mapper.setdefault(state.mapper, []).append(state.identity)
+
+        dialect = session.get_bind().dialect
+        for mapper, identities in identities_by_mapper.items():
+            columns = mapper.primary_key
+            size = max_parameters(dialect) // len(columns)
+            for chunk in chunked(identities, size):
+                query = session.query(mapper).populate_existing()
+                query.filter(primary_key_in(columns, chunk)).all()
+
+    def _refresh_returning(self, items):
+        pass
+
+    def _refresh_none(self, items):
+        pass
+
+    def _merge(self, result):
+        if isinstance(result, _ITERABLES):
+            return [self._merge(item) for item in result]
+        return self.session.merge(result)
+
+
+def _in_transaction(session):
+    if hasattr(session, "in_transaction"):
+        return session.in_transaction()
+    return session.transaction is not None
+
+
+def _discriminator(mapper) -> Optional[Tuple[str, Any]]:
+    """Return the column key and value which identify `mapper`'s class, when polymorphic.
+
+    Inserting directly bypasses the ORM, which would otherwise set it.
+    """
+    if mapper.polymorphic_on is None:
+        return None
+
+    column = mapper.polymorphic_on
+    if (
+        mapper.polymorphic_identity is None
+        or getattr(column, "table", None) is not mapper.local_table
+    ):
+        raise ValueError(
+            f"{mapper.class_.__name__} has no polymorphic identity (stored in a column of its "
+            "table), and so cannot be inserted directly."
+        )
+    return column.key, mapper.polymorphic_identity
+
+
+def _count_models(result) -> int:
+    if isinstance(result, _ITERABLES):
+        return sum(1 for _ in _iter_models(result))
+    return 1
+
+
+class _NoSpan:
+    """Stand in for `Hooks.span`, while no listeners are registered."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *_):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _iter_models(result):
+    """Yield the individual models from a (potentially nested) factory result.
+
+    Examples:
+        >>> list(_iter_models([1, (2, 3), [4, [5]]]))
+        [1, 2, 3, 4, 5]
+    """
+    if isinstance(result, _ITERABLES):
+        for item in result:
+            yield from _iter_models(item)
+    else:
+        yield result
+
 
 class Namespace:
     """Represent a collection of registered namespaces or callable `Method`s.
@@ -116,6 +616,9 @@ class Namespace:
     def from_registry(cls, registry: Registry, manager=None):
         """Produce a `Namespace` tree structure from a flat `Registry` structure.
 
+        The tree is only built once per version of the registry, and subsequently
+        bound to the given `manager` (lazily, as it's traversed).
+
         Examples:
             >>> registry = Registry()
             >>> @registry.register_at("foo", name='bar')
@@ -132,6 +635,13 @@ class Namespace:
             >>> namespace.foo.bar()
             5
         """
+        namespace = registry.cached(cls, cls._build_from_registry)
+        if manager is None:
+            return namespace
+        return namespace.bind(manager)
+
+    @classmethod
+    def _build_from_registry(cls, registry: Registry):
         tree: Dict[str, Any] = {}
 
         for namespace in registry.namespaces():
@@ -141,9 +651,12 @@ class Namespace:
 
             methods = registry.methods(*namespace)
             for name, method in methods.items():
+                # Recompile, in case the function was decorated further (i.e. `for_model`)
+                # after having been registered.
+                method.plan = CallPlan.compile(method, path=(*namespace, name))
                 context.setdefault(name, {})["__call__"] = method
 
-        return cls.from_tree(tree, manager=manager)
+        return cls.from_tree(tree)
 
     @classmethod
     def from_tree(cls, tree, manager=None):
@@ -160,12 +673,52 @@ class Namespace:
     def __init__(self, __call__: Optional[Method] = None, *, _manager=None, **attrs):
         self.__manager = _manager
         self.__method = __call__
+        self.__plan: Optional[CallPlan] = None
+        self.__source = None
 
         for attr, value in attrs.items():
             setattr(self, attr, value)
 
+    def bind(self, manager):
+        """Produce a view of this `Namespace` tree which is bound to the given `manager`.
+
+        Nested namespaces are bound lazily, as they are accessed, such that binding a large
+        tree is cheap.
+
+        Examples:
+            >>> from sqlalchemy_model_factory.registry import Method
+            >>> namespace = Namespace(foo=Namespace(Method(lambda: 1)))
+            >>> bound = namespace.bind(manager=None)
+            >>> bound.foo()
+            1
+        """
+        bound = self.__class__(self.__method, _manager=manager)
+        bound.__plan = self.__plan
+        bound.__source = self
+
+        # Nested namespaces which share a name with a `Namespace` method must be bound
+        # up front, because the method would otherwise be found before `__getattr__`.
+        for attr in _NAMESPACE_ATTRS.intersection(self.__dict__):
+            bound.__bind(attr)
+        return bound
+
+    def __bind(self, attr):
+        value = self.__source.__dict__[attr]
+        if isinstance(value, Namespace):
+            value = value.bind(self.__manager)
+
+        # Cache the bound value, so that subsequent accesses needn't pass through here.
+        setattr(self, attr, value)
+        return value
+
     def __getattr__(self, attr):
         """Catch unset attribute names to provide a better error message."""
+        source = self.__dict__.get("_Namespace__source")
+        if source is not None:
+            if attr in source.__dict__:
+                return self.__bind(attr)
+            return getattr(source, attr)
+
         namespaces = []
         methods = []
         for name, item in self.__dict__.items():
@@ -189,48 +742,295 @@ class Namespace:
             f"{self.__class__.__name__} has no attribute '{attr}'. Available methods include: {method_names}. Available nested namespaces include: {namespace_names}."
         )
 
-    def __call__(self, *args, commit_=None, merge_=None, **kwargs):
+    def __call__(
+        self,
+        *args,
+        commit_=None,
+        merge_=None,
+        refresh_=None,
+        count_=None,
+        core_=None,
+        **kwargs,
+    ):
         """Provide an access guarding mechanism around callables.
 
         Allows for a hook into, for example, the calling of namespace functions
         for the purposes of keeping track of the results of the function calls,
         or otherwise manipulating the input arguments.
+
+        When `count_` is supplied, the factory is called `count_` times with the
+        same arguments, and the list of results is added to the session at once,
+        such that they're all inserted with a single flush/commit.
+
+        When `core_` is set (or defaulted by `for_model(..., core=True)`), the mappings
+        produced by a `for_model` factory are inserted directly, returning the primary
+        key identities of the inserted rows rather than models.
         """
-        if self.__method is None:
-            raise RuntimeError(
-                f"{self} has no registered factory function and cannot be called."
+        plan = self.__plan or self.__compile()
+
+        if plan.core if core_ is None else core_:
+            mapping = plan.mapping
+            if count_ is None:
+
+                def produce():
+                    return mapping(*args, **kwargs)
+
+            else:
+
+                def produce():
+                    return [mapping(*args, **kwargs) for _ in range(count_)]
+
+            return self.__call_core(plan, produce, args, kwargs, commit_)
+
+        target = plan.target
+
+        if getattr(self.__manager, "instrumented", False):
+            if count_ is None:
+
+                def produce():
+                    return target(*args, **kwargs)
+
+            else:
+
+                def produce():
+                    return [target(*args, **kwargs) for _ in range(count_)]
+
+            return self.__call_instrumented(
+                plan, produce, args, kwargs, commit_, merge_, refresh_
             )
 
-        callable = self.__method.fn
-        if hasattr(callable, "for_model"):
-            callable = callable.for_model
+        if count_ is None:
+            result = target(*args, **kwargs)
+        else:
+            result = [target(*args, **kwargs) for _ in range(count_)]
+
+        return self.__add_result(plan, result, commit_, merge_, refresh_)
 
-        result = callable(*args, **kwargs)
+    def __call_instrumented(
+        self, plan, produce, args, kwargs, commit_, merge_, refresh_
+    ):
+        return self.__manager.call(
+            plan,
+            produce,
+            args,
+            kwargs,
+            commit=plan.commit if commit_ is None else commit_,
+            merge=plan.merge if merge_ is None else merge_,
+            refresh=plan.refresh if refresh_ is None else refresh_,
+        )
 
-        if self.__manager:
-            commit = (
-                commit_
-                if commit_ is not None
-                else self.__method.commit
-                if self.__method.commit is not None
-                else True
+    def __call_core(self, plan, produce, args, kwargs, commit_):
+        if not plan.for_model or plan.model is None:
+            name = ".".join(plan.path) or plan.target
+            raise ValueError(
+                f"`core_` requires a `for_model` factory, which {name} is not."
             )
-            merge = (
-                merge_
-                if merge_ is not None
-                else self.__method.merge
-                if self.__method.merge is not None
-                else False
+
+        manager = self.__manager
+        if manager is None:
+            return produce()
+
+        if not hasattr(manager, "insert_mappings"):
+            raise TypeError(
+                f"`core_` is not supported by {manager.__class__.__name__}."
             )
-            result = self.__manager.add_result(result, commit=commit, merge=merge)
-        return result
+
+        commit = plan.commit if commit_ is None else commit_
+        if getattr(manager, "instrumented", False):
+            return manager.call(
+                plan, produce, args, kwargs, commit, False, None, core=True
+            )
+        return manager.insert_mappings(plan.model, produce(), commit=commit)
+
+    def __add_result(self, plan, result, commit_, merge_, refresh_):
+        manager = self.__manager
+        if manager is None:
+            return result
+
+        return manager.add_result(
+            result,
+            commit=plan.commit if commit_ is None else commit_,
+            merge=plan.merge if merge_ is None else merge_,
+            refresh=plan.refresh if refresh_ is None else refresh_,
+        )
+
+    def many(self, calls, *, commit_=None, merge_=None, refresh_=None, core_=None):
+        """Call the factory once per item in `calls`, adding all the results at once.
+
+        Each item in `calls` should be a mapping of keyword arguments to supply
+        to one call of the factory. The list of results is added to the session
+        with a single flush/commit.
+
+        Examples:
+            >>> from sqlalchemy_model_factory.registry import Method
+            >>> namespace = Namespace(Method(lambda a, b=2: a + b))
+            >>> namespace.many([{'a': 1}, {'a': 1, 'b': 5}])
+            [3, 6]
+        """
+        plan = self.__plan or self.__compile()
+
+        if plan.core if core_ is None else core_:
+            mapping = plan.mapping
+            return self.__call_core(
+                plan,
+                lambda: [mapping(**call_kwargs) for call_kwargs in calls],
+                (calls,),
+                {},
+                commit_,
+            )
+
+        target = plan.target
+
+        if getattr(self.__manager, "instrumented", False):
+            return self.__call_instrumented(
+                plan,
+                lambda: [target(**call_kwargs) for call_kwargs in calls],
+                (calls,),
+                {},
+                commit_,
+                merge_,
+                refresh_,
+            )
+
+        result = [target(**call_kwargs) for call_kwargs in calls]
+        return self.__add_result(plan, result, commit_, merge_, refresh_)
+
+    def batch(self):
+        """Defer the flush/commit of all factory calls made inside a `with` block.
+
+        Examples:
+            >>> def test_widgets(mf):
+            ...     with mf.batch():
+            ...         widget = mf.widget.new()
+            ...         mf.widget.new(count_=10)
+            ...
+            ...     # All 11 widgets have now been committed, at once.
+        """
+        return self.__require_manager().batch()
+
+    def flush(self):
+        """Flush and commit any factory calls deferred by an in-progress `batch`."""
+        return self.__require_manager().flush()
+
+    def stream(
+        self,
+        count,
+        *args,
+        chunk_size=5000,
+        pks=False,
+        commit_=None,
+        merge_=None,
+        refresh_=None,
+        **kwargs,
+    ):
+        """Call the factory `count` times, yielding the results one chunk at a time.
+
+        Each chunk of (at most `chunk_size`) results is flushed, committed and expunged
+        before the next is produced, rather than materializing every result at once.
+        When `pks` is set, the primary key identities of the results are yielded instead.
+
+        Examples:
+            >>> from sqlalchemy_model_factory.registry import Method
+            >>> namespace = Namespace(Method(lambda a: a * 2))
+            >>> list(namespace.stream(3, 1, chunk_size=2))
+            [2, 2, 2]
+
+            >>> def test_events(mf):
+            ...     for event_id, in mf.event.new.stream(1_000_000, pks=True):
+            ...         ...
+        """
+        plan = self.__plan or self.__compile()
+        target = plan.target
+
+        def produce():
+            return target(*args, **kwargs)
+
+        if self.__manager is None:
+            return (produce() for _ in range(count))
+
+        return self.__require_method("stream")(
+            produce,
+            count,
+            chunk_size=chunk_size,
+            pks=pks,
+            commit=plan.commit if commit_ is None else commit_,
+            merge=plan.merge if merge_ is None else merge_,
+            refresh=plan.refresh if refresh_ is None else refresh_,
+        )
+
+    def parallel(self, workers: int, chunk_size=None):
+        """Produce a view of the factories, whose results are inserted by a pool of threads.
+
+        Each chunk of (at most `chunk_size`) results is inserted and committed through a
+        separate session by one of `workers` threads.
+
+        Examples:
+            >>> def test_orders(mf):
+            ...     orders = mf.parallel(workers=8).order.new(count_=100_000)
+        """
+        return self.__require_method("parallel")(workers, chunk_size=chunk_size)
+
+    def stats(self):
+        """Return the `FactoryStats` recorded per factory path, when the `profile` option is set.
+
+        Examples:
+            >>> def test_widgets(mf):
+            ...     mf.widget.new(count_=3)
+            ...     stats = mf.stats()["widget.new"]
+            ...     assert stats.calls == 1
+        """
+        return self.__require_method("stats")()
+
+    def created(self, model_cls=None):
+        """Return the models produced by factories, optionally filtered by model class.
+
+        Models are returned in the order they were produced.
+
+        Examples:
+            >>> def test_widgets(mf):
+            ...     mf.widget.new(count_=3)
+            ...     assert len(mf.created(Widget)) == 3
+        """
+        return self.__require_manager().created(model_cls)
+
+    def created_count(self, model_cls=None):
+        """Return the number of models produced by factories, optionally filtered by model class."""
+        return self.__require_manager().created_count(model_cls)
+
+    def __require_manager(self):
+        if self.__manager is None:
+            raise RuntimeError(f"{self} is not bound to a `ModelFactory`.")
+        return self.__manager
+
+    def __require_method(self, name):
+        manager = self.__require_manager()
+        method = getattr(manager, name, None)
+        if method is None:
+            raise TypeError(
+                f"`{name}` is not supported by {manager.__class__.__name__}."
+            )
+        return method
+
+    def __compile(self):
+        if self.__method is None:
+            raise RuntimeError(
+                f"{self} has no registered factory function and cannot be called."
+            )
+
+        # Methods registered through a `Registry` arrive precompiled.
+        plan = self.__method.plan or CallPlan.compile(self.__method)
+        self.__plan = plan
+        return plan
 
     def __repr__(self):
+        if self.__source is not None:
+            return repr(self.__source)
+
         cls_name = self.__class__.__name__
 
         attrs = []
         for key, value in self.__dict__.items():
-            if key.endswith("__manager"):
+            if key in _PRIVATE_ATTRS:
                 continue
 
             if key == f"_{cls_name}__method":
@@ -243,3 +1043,12 @@ class Namespace:
 
         attrs_str = ", ".join(attrs)
         return f"{cls_name}({attrs_str})"
+
+
+_PRIVATE_ATTRS = frozenset(
+    f"_{Namespace.__name__}__{name}" for name in ("manager", "plan", "source")
+)
+
+_NAMESPACE_ATTRS = frozenset(
+    name for name in vars(Namespace) if not name.startswith("_")
+)
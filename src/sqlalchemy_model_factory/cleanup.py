@@ -0,0 +1,293 @@
+"""Strategies for reverting the data produced by a `ModelFactory`.
+
+The strategy in use is selected through the `cleanup` option. Each strategy is
+given the opportunity to prepare the session when the `ModelFactory` context is
+entered, and to remove the managed data when it is exited.
+"""
+from typing import Set
+
+from sqlalchemy import column, event, inspect, Table, table, text
+from sqlalchemy.schema import sort_tables
+from sqlalchemy.sql.expression import Insert
+from sqlalchemy_model_factory.sql import (
+    primary_key_chunks,
+    primary_key_in,
+    secondary_references,
+)
+
+
+class Cleanup:
+    """Define the interface through which a `ModelFactory` reverts its data."""
+
+    name: str = ""
+
+    def start(self, manager):
+        """Prepare the manager's session, upon entering the `ModelFactory` context."""
+
+    def finish(self, manager):
+        """Remove the data produced by the manager, upon exiting the `ModelFactory` context."""
+
+
+class NoCleanup(Cleanup):
+    """Leave all produced data in place."""
+
+    name = "none"
+
+
+class DeleteCleanup(Cleanup):
+    """Delete the models produced by the factory.
+
+    Tracked models are grouped by table, and the tables are visited in reverse
+    dependency order, issuing one `DELETE ... WHERE <pk> IN (...)` per table (chunked
+    to the dialect's bound parameter limit), rather than one flush per model.
+    """
+
+    name = "delete"
+
+    def finish(self, manager):
+        session = manager.session
+
+        # Events inside the context manager could have left pending state.
+        session.rollback()
+
+        if getattr(session, "autocommit", None):
+            session.begin()
+
+        dialect = session.get_bind().dialect
+        identities_by_table = manager.new_models.identities_by_table()
+
+        # Rows of many-to-many association tables which reference the produced models
+        # have no model of their own, and must be removed before the rows they reference.
+        mappers = [inspect(cls) for cls in manager.new_models.classes()]
+        secondaries = secondary_references(mappers, identities_by_table)
+
+        tables = set(identities_by_table) | set(secondaries)
+        for model_table in reversed(sort_tables(tables)):
+            for referenced, references in secondaries.get(model_table, []):
+                identities = identities_by_table[referenced]
+                for columns, chunk in primary_key_chunks(
+                    referenced, identities, dialect, references
+                ):
+                    delete = model_table.delete().where(primary_key_in(columns, chunk))
+                    session.execute(delete)
+
+            identities = identities_by_table.get(model_table, [])
+            for columns, chunk in primary_key_chunks(model_table, identities, dialect):
+                delete = model_table.delete().where(primary_key_in(columns, chunk))
+                session.execute(delete)
+
+        for model in manager.new_models.models():
+            if model in session:
+                session.expunge(model)
+
+        manager.new_models.clear()
+
+        if manager.options.commit:
+            session.commit()
+
+
+class RollbackCleanup(Cleanup):
+    """Run the whole `ModelFactory` context inside a single, outer transaction.
+
+    The session is bound to a connection on which a transaction is started up front.
+    Commits performed by the session (whether by the factory or the code under test)
+    then only release SAVEPOINTs, so that every change can be reverted with one
+    ROLLBACK of the outer transaction, regardless of how much data was produced.
+
+    *Note* the code under test must use the same session (or its connection) for its
+    changes to be reverted. Additionally, the pysqlite driver requires some assistance
+    in order to correctly handle SAVEPOINTs, see `enable_sqlite_savepoints`.
+    """
+
+    name = "rollback"
+
+    def __init__(self):
+        self.connection = None
+        self.transaction = None
+        self.bind = None
+        self.join_transaction_mode = None
+
+    def start(self, manager):
+        session = manager.session
+
+        # Any transaction already in progress would be outside our outer transaction.
+        session.close()
+
+        self.bind = session.bind
+        self.connection = session.get_bind().connect()
+        self.transaction = self.connection.begin()
+        session.bind = self.connection
+
+        if hasattr(session, "join_transaction_mode"):
+            self.join_transaction_mode = session.join_transaction_mode
+            session.join_transaction_mode = "create_savepoint"
+        else:
+            # Prior to SQLAlchemy 2.0, the session must be manually kept within a SAVEPOINT.
+            session.begin_nested()
+            event.listen(session, "after_transaction_end", _restart_savepoint)
+
+    def finish(self, manager):
+        session = manager.session
+
+        if self.join_transaction_mode is None:
+            event.remove(session, "after_transaction_end", _restart_savepoint)
+        else:
+            session.join_transaction_mode = self.join_transaction_mode
+
+        session.close()
+        session.bind = self.bind
+
+        self.transaction.rollback()
+        self.connection.close()
+
+        self.connection = None
+        self.transaction = None
+        manager.new_models.clear()
+
+
+class TruncateCleanup(Cleanup):
+    """Clear every table which was inserted into during the `ModelFactory` context.
+
+    Inserts are detected by listening to the engine's statement execution (which
+    includes those emitted by the ORM), and so this will also capture rows written
+    by the code under test (so long as it uses the same engine), in contrast to the
+    "delete" strategy which only reverts rows produced by the factory.
+
+    The tables are cleared using the fastest available dialect-specific mechanism:
+
+    * postgresql: `TRUNCATE ... RESTART IDENTITY CASCADE`
+    * sqlite: one `DELETE` per table, plus a reset of `sqlite_sequence`
+    * otherwise: one `DELETE` per table, in reverse dependency order
+
+    *Note* this clears the **whole** table, including rows which existed before
+    the `ModelFactory` context was entered.
+    """
+
+    name = "truncate"
+
+    def __init__(self):
+        self.engine = None
+        self.tables: Set = set()
+
+    def start(self, manager):
+        self.engine = manager.session.get_bind().engine
+        event.listen(self.engine, "after_execute", self._record)
+
+    def _record(self, conn, clauseelement, *_):
+        if isinstance(clauseelement, Insert):
+            self.tables.add(clauseelement.table)
+
+    def finish(self, manager):
+        event.remove(self.engine, "after_execute", self._record)
+
+        session = manager.session
+        session.rollback()
+
+        if getattr(session, "autocommit", None):
+            session.begin()
+
+        tables = [t for t in sort_tables(self.tables) if isinstance(t, Table)]
+        if tables:
+            dialect = session.get_bind().dialect
+            if dialect.name == "postgresql":
+                self._truncate(session, tables)
+            else:
+                self._delete(session, tables)
+
+        session.expunge_all()
+        self.tables.clear()
+        manager.new_models.clear()
+
+        if manager.options.commit:
+            session.commit()
+
+    def _truncate(self, session, tables):
+        format_table = session.get_bind().dialect.identifier_preparer.format_table
+        table_names = ", ".join(format_table(t) for t in tables)
+        session.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
+
+    def _delete(self, session, tables):
+        for t in reversed(tables):
+            session.execute(t.delete())
+
+        if session.get_bind().dialect.name != "sqlite":
+            return
+
+        # `sqlite_sequence` only exists once some `AUTOINCREMENT` table has been created.
+        has_sequence = session.execute(
+            text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+            )
+        ).scalar()
+        if has_sequence:
+            name = column("name")
+            sqlite_sequence = table("sqlite_sequence", name)
+            session.execute(
+                sqlite_sequence.delete().where(name.in_([t.name for t in tables]))
+            )
+
+
+def _restart_savepoint(session, transaction):
+    if transaction.nested and not transaction._parent.nested:
+        session.expire_all()
+        session.begin_nested()
+
+
+_STRATEGIES = {
+    None: NoCleanup,
+    False: NoCleanup,
+    True: DeleteCleanup,
+    NoCleanup.name: NoCleanup,
+    DeleteCleanup.name: DeleteCleanup,
+    RollbackCleanup.name: RollbackCleanup,
+    TruncateCleanup.name: TruncateCleanup,
+}
+
+
+def get_cleanup(cleanup) -> Cleanup:
+    """Produce the `Cleanup` strategy for a given `cleanup` option value.
+
+    Examples:
+        >>> get_cleanup(True)
+        <...DeleteCleanup object at ...>
+
+        >>> get_cleanup("rollback")
+        <...RollbackCleanup object at ...>
+
+        >>> get_cleanup("wat")
+        Traceback (most recent call last):
+        ValueError: Unrecognized cleanup option 'wat', expected one of: delete, none, rollback, truncate
+    """
+    if isinstance(cleanup, Cleanup):
+        return cleanup
+
+    try:
+        strategy = _STRATEGIES[cleanup]
+    except (KeyError, TypeError):
+        options = sorted(key for key in _STRATEGIES if isinstance(key, str))
+        raise ValueError(
+            f"Unrecognized cleanup option {cleanup!r}, expected one of: {', '.join(options)}"
+        )
+    return strategy()
+
+
+def enable_sqlite_savepoints(engine):
+    """Configure a pysqlite `engine` to correctly support SAVEPOINTs.
+
+    The pysqlite driver defers emitting BEGIN until the first DML statement, which
+    breaks SAVEPOINT handling. This applies the workaround described in the SQLAlchemy
+    SQLite dialect documentation, so that the "rollback" cleanup option can be used.
+    """
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        if hasattr(connection, "exec_driver_sql"):
+            connection.exec_driver_sql("BEGIN")
+        else:
+            connection.execute("BEGIN")
+
+    return engine
@@ -0,0 +1,246 @@
+r"""Run registered factories outside of a test suite, to seed a database.
+
+Examples:
+    The scenario is a JSON list of the factory calls to make, each of which is performed
+    `count` times, with the given keyword arguments.
+
+    .. code-block:: json
+
+        [
+            {"factory": "customer.new", "count": 1000},
+            {"factory": "order.new", "count": 100000, "kwargs": {"status": "open"}}
+        ]
+
+    .. code-block:: bash
+
+        python -m sqlalchemy_model_factory seed myapp.factories:registry scenario.json \\
+            --url postgresql://localhost/loadtest --workers 8
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy_model_factory.base import ModelFactory
+from sqlalchemy_model_factory.registry import Registry
+from sqlalchemy_model_factory.utils import set_worker_index
+
+# Seeded data is meant to persist, and nothing need be retained about the produced models.
+SEED_OPTIONS = {"cleanup": False, "track": "pk", "expunge": True, "refresh": "none"}
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def load_reference(reference: str):
+    """Import the object referred to by a "module:attribute" `reference`.
+
+    Examples:
+        >>> load_reference("sqlalchemy_model_factory.registry:registry")
+        <sqlalchemy_model_factory.registry.Registry object at ...>
+
+        >>> load_reference("sqlalchemy_model_factory")
+        Traceback (most recent call last):
+        ValueError: Expected a reference of the form 'module:attribute', got 'sqlalchemy_model_factory'
+    """
+    module_name, _, attrs = reference.partition(":")
+    if not module_name or not attrs:
+        raise ValueError(
+            f"Expected a reference of the form 'module:attribute', got {reference!r}"
+        )
+
+    value = importlib.import_module(module_name)
+    for attr in attrs.split("."):
+        value = getattr(value, attr)
+    return value
+
+
+def load_registry(reference: str) -> Registry:
+    """Import a `Registry`, or declarative factory class, by its "module:attribute" reference."""
+    value = load_reference(reference)
+
+    registry = getattr(value, "registry", value)
+    if not isinstance(registry, Registry):
+        raise ValueError(
+            f"{reference!r} is neither a `Registry`, nor a declarative factory class"
+        )
+    return registry
+
+
+def load_scenario(path: str) -> List[Dict]:
+    """Read and validate the list of steps in a scenario file."""
+    with open(path) as f:
+        steps = json.load(f)
+
+    if not isinstance(steps, list):
+        raise ValueError("A scenario must be a list of steps")
+
+    for step in steps:
+        if not isinstance(step, dict) or "factory" not in step:
+            raise ValueError(f"Each scenario step requires a 'factory', got {step!r}")
+        step.setdefault("count", 1)
+        step.setdefault("kwargs", {})
+    return steps
+
+
+def split_count(count: int, parts: int) -> List[int]:
+    """Divide `count` as evenly as possible into `parts`.
+
+    Examples:
+        >>> split_count(10, 3)
+        [4, 3, 3]
+    """
+    size, remainder = divmod(count, parts)
+    return [size + (1 if index < remainder else 0) for index in range(parts)]
+
+
+def seed(
+    registry_reference: str,
+    url: str,
+    steps: List[Dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Perform the scenario `steps` against the database at `url`, returning the rows produced.
+
+    The registry is given by reference, rather than directly, such that this can be
+    performed by a worker process, which imports the registry itself.
+    """
+    registry = load_registry(registry_reference)
+
+    engine = create_engine(url)
+    session = sessionmaker(bind=engine)()
+    try:
+        with ModelFactory(registry, session, options=SEED_OPTIONS) as mf:
+            for step in steps:
+                namespace = mf
+                for attr in step["factory"].split("."):
+                    namespace = getattr(namespace, attr)
+
+                remaining = step["count"]
+                while remaining > 0:
+                    count = min(remaining, chunk_size)
+                    namespace(count_=count, **step["kwargs"])
+                    remaining -= count
+
+            return mf.created_count()
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _seed_worker(args):
+    return seed(*args)
+
+
+def _init_worker(counter):
+    # Each process draws its `autoincrement` values from a partition of its own, as
+    # pytest-xdist workers do, such that unique columns don't collide between them.
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    set_worker_index(index)
+
+
+def run_seed(
+    registry_reference: str,
+    url: str,
+    steps: List[Dict],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Spread the scenario `steps` over `workers` processes, each with its own engine.
+
+    Each process is given a distinct `worker_index`, such that their `autoincrement`
+    sequences produce distinct values.
+    """
+    worker_steps: List[List[Dict]] = [[] for _ in range(workers)]
+    for step in steps:
+        for index, count in enumerate(split_count(step["count"], workers)):
+            if count:
+                worker_steps[index].append({**step, "count": count})
+
+    jobs = [
+        (registry_reference, url, job_steps, chunk_size)
+        for job_steps in worker_steps
+        if job_steps
+    ]
+    if workers == 1:
+        return sum(map(_seed_worker, jobs))
+
+    counter = multiprocessing.Value("i", 0)
+    with multiprocessing.Pool(
+        processes=workers, initializer=_init_worker, initargs=(counter,)
+    ) as pool:
+        return sum(pool.map(_seed_worker, jobs))
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m sqlalchemy_model_factory")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    seed_parser = commands.add_parser(
+        "seed", help="Fill a database using registered factories."
+    )
+    seed_parser.add_argument(
+        "registry",
+        help="The 'module:attribute' reference to a `Registry` or declarative factory class.",
+    )
+    seed_parser.add_argument("scenario", help="The path to a JSON scenario file.")
+    seed_parser.add_argument("--url", required=True, help="The database URL.")
+    seed_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes (default: %(default)s).",
+    )
+    seed_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="The number of factory calls inserted at once (default: %(default)s).",
+    )
+    seed_parser.add_argument(
+        "--metadata",
+        help="The 'module:attribute' reference to a `MetaData`, whose tables are created first.",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be at least 1")
+
+    try:
+        load_registry(args.registry)
+        steps = load_scenario(args.scenario)
+        metadata = load_reference(args.metadata) if args.metadata else None
+    except (ImportError, AttributeError, OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if metadata is not None:
+        engine = create_engine(args.url)
+        try:
+            metadata.create_all(engine)
+        finally:
+            engine.dispose()
+
+    start = time.perf_counter()
+    rows = run_seed(
+        args.registry,
+        args.url,
+        steps,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    elapsed = time.perf_counter() - start
+
+    rate = rows / elapsed if elapsed else 0
+    print(f"Inserted {rows} rows in {elapsed:.2f}s ({rate:.0f} rows/sec)")
+    return 0
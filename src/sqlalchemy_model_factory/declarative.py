@@ -99,7 +99,9 @@ def declarative(_cls=None, *, registry=None):
     return _root_declarative
 
 
-def factory(merge=None, commit=None) -> Callable[[Callable[..., R]], Method[R]]:
+def factory(
+    merge=None, commit=None, refresh=None
+) -> Callable[[Callable[..., R]], Method[R]]:
     """Annotate declaratively specified factory functions.
 
     This is an optional addition in the common case. Normally, factory functions
@@ -110,7 +112,7 @@ def factory(merge=None, commit=None) -> Callable[[Callable[..., R]], Method[R]]:
     """
 
     def decorator(fn: Callable[..., R]) -> Method[R]:
-        return Method(fn, merge=merge, commit=commit)
+        return Method(fn, merge=merge, commit=commit, refresh=refresh)
 
     return decorator
 
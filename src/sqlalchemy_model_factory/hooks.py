@@ -0,0 +1,138 @@
+"""Dispatch events around the lifecycle of factory calls, to externally registered listeners.
+
+Listeners are registered once per `Registry`, and receive a `FactoryEvent` for each event,
+for example to emit tracing spans or metrics.
+
+Examples:
+    >>> from sqlalchemy_model_factory.registry import Registry
+    >>> registry = Registry()
+
+    >>> @registry.listens_for("after_call")
+    ... def record(event):
+    ...     print(event.path, event.size, event.elapsed >= 0)
+"""
+import contextlib
+import time
+from typing import Callable, Dict, List, Optional
+
+EVENTS = frozenset(
+    f"{when}_{name}"
+    for when in ("before", "after")
+    for name in ("call", "add_result", "flush", "commit", "refresh", "cleanup")
+)
+
+
+class FactoryEvent:
+    """Describe one event in the lifecycle of a factory call.
+
+    * `name`: The name of the event, i.e. "after_call".
+    * `path`: The registered path of the factory being called (i.e. "widget.new"), if any.
+    * `args`/`kwargs`: The arguments to the factory call ("call" events only).
+    * `result`: The result of the factory call ("after_call" and "after_add_result" only).
+    * `size`: The number of models involved, where known.
+    * `elapsed`: The seconds elapsed since the corresponding "before" event ("after" events only).
+    * `error`: The exception raised, if any ("after" events only).
+    """
+
+    __slots__ = ("name", "path", "args", "kwargs", "result", "size", "elapsed", "error")
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        args: tuple = (),
+        kwargs: Optional[Dict] = None,
+        result=None,
+        size: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.name = name
+        self.path = path
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.result = result
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.name}, path={self.path}, size={self.size}, "
+            f"elapsed={self.elapsed})"
+        )
+
+
+class Hooks:
+    """Hold the listeners registered for each event.
+
+    `active` is only set while some listener is registered, such that the cost of
+    the hooks (when unused) is that of checking it.
+
+    Examples:
+        >>> hooks = Hooks()
+        >>> events = []
+        >>> hooks.listen("before_cleanup", events.append)
+        >>> hooks.active
+        True
+
+        >>> with hooks.span("cleanup", size=3):
+        ...     pass
+        >>> events
+        [FactoryEvent(before_cleanup, path=None, size=3, elapsed=None)]
+
+        >>> hooks.remove("before_cleanup", events.append)
+        >>> hooks.active
+        False
+
+        >>> hooks.listen("wat", print)
+        Traceback (most recent call last):
+        ValueError: Unrecognized event 'wat'
+    """
+
+    def __init__(self):
+        self._listeners: Dict[str, List[Callable]] = {}
+        self.active = False
+
+    def listen(self, name: str, fn: Callable):
+        if name not in EVENTS:
+            raise ValueError(f"Unrecognized event {name!r}")
+
+        self._listeners.setdefault(name, []).append(fn)
+        self.active = True
+
+    def remove(self, name: str, fn: Callable):
+        listeners = self._listeners.get(name, [])
+        listeners.remove(fn)
+        if not listeners:
+            self._listeners.pop(name, None)
+        self.active = bool(self._listeners)
+
+    def dispatch(self, event: FactoryEvent):
+        for listener in self._listeners.get(event.name, ()):
+            listener(event)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        size: Optional[int] = None,
+        **fields,
+    ):
+        """Dispatch the "before" event of `name`, and then its "after" event upon exiting the block.
+
+        The "after" event is yielded, such that its `result`/`size` can be supplied.
+        """
+        self.dispatch(FactoryEvent(f"before_{name}", path=path, size=size, **fields))
+
+        after = FactoryEvent(f"after_{name}", path=path, size=size, **fields)
+        start = time.perf_counter()
+        try:
+            yield after
+        except BaseException as e:
+            after.error = e
+            raise
+        finally:
+            after.elapsed = time.perf_counter() - start
+            self.dispatch(after)
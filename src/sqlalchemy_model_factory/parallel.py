@@ -0,0 +1,161 @@
+"""Spread the insertion of factory results over a pool of threads."""
+import concurrent.futures
+from typing import List, Optional
+
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+from sqlalchemy_model_factory.base import _count_models, _iter_models
+from sqlalchemy_model_factory.cleanup import RollbackCleanup
+from sqlalchemy_model_factory.sql import chunked
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class ParallelModelFactory:
+    """Insert the results of factory calls through a pool of worker threads.
+
+    Each chunk of results is added, flushed and committed by one of the workers, in a
+    session of its own (produced by a `sessionmaker` bound to the parent session's engine),
+    such that I/O bound inserts can overlap. The models committed by the workers are
+    tracked by the parent `ModelFactory`, and are therefore reverted by its cleanup.
+
+    Produced through `mf.parallel(workers=N)`, rather than directly.
+
+    *Note* the worker sessions commit independently of the parent session. Factory
+    arguments which are attached to the parent session cannot be added to a worker
+    session, and so such calls should be made with `merge_=True`. Results are
+    returned detached, with only the state which was loaded upon their insertion.
+    """
+
+    def __init__(self, manager, workers: int, chunk_size: Optional[int] = None):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        if isinstance(manager.cleanup, RollbackCleanup):
+            raise ValueError(
+                "The 'rollback' cleanup option cannot be used with `parallel`, because the "
+                "worker sessions cannot join the outer transaction."
+            )
+
+        if not manager.options.commit:
+            raise ValueError(
+                "The `commit` option cannot be disabled with `parallel`, because each "
+                "worker commits its own session."
+            )
+
+        session = manager.session
+        if _single_connection(session.get_bind().engine):
+            raise ValueError(
+                "`parallel` requires an engine whose pool provides a connection per "
+                "worker, rather than a single shared connection (i.e. `StaticPool`, or "
+                "an in-memory SQLite database). Use a file-based SQLite database instead."
+            )
+
+        self.manager = manager
+        self.workers = workers
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+
+        self.session_factory = sessionmaker(
+            bind=session.get_bind(), class_=type(session), expire_on_commit=False
+        )
+
+    @property
+    def instrumented(self) -> bool:
+        return self.manager.instrumented
+
+    def call(self, plan, produce, args, kwargs, commit, merge, refresh, core=False):
+        """Call `produce` and add its result, through the parent `ModelFactory.call`."""
+        return self.manager.call(
+            plan, produce, args, kwargs, commit, merge, refresh, core=core, manager=self
+        )
+
+    def add_result(self, result, commit=True, merge=False, refresh=None):
+        if not self.manager.hooks.active:
+            return self._add_result(result, commit, merge, refresh)
+
+        with self.manager._span("add_result", size=_count_models(result)) as span:
+            result = self._add_result(result, commit, merge, refresh)
+            span.result = result
+        return result
+
+    def _add_result(self, result, commit, merge, refresh):
+        if self.manager._batch_depth:
+            raise RuntimeError("`parallel` cannot be used inside of a `batch`.")
+
+        if not commit:
+            raise ValueError(
+                "`parallel` cannot defer the commit (`commit_=False`), because each worker "
+                "commits its own session."
+            )
+
+        refresh = self.manager._refresh_strategy(refresh)
+        if refresh == "expire":
+            raise ValueError(
+                "The 'expire' refresh strategy cannot be used with `parallel`, because "
+                "its results are detached."
+            )
+
+        chunks = chunked(_iter_models(result), self.chunk_size)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(self._insert, chunk, merge, refresh) for chunk in chunks
+            ]
+
+        # Every chunk is tracked before raising, so that the cleanup can still revert the
+        # chunks which were committed, despite the failure of another.
+        error = None
+        results: List = []
+        for future in futures:
+            try:
+                models, flushed = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+
+            results.extend(models)
+            self.manager.new_models.add_all(flushed)
+
+        if error is not None:
+            raise error
+
+        if merge or isinstance(result, (list, tuple, set)):
+            return results
+        return results[0] if results else result
+
+    def _insert(self, models, merge, refresh):
+        session = self.session_factory()
+        try:
+            if merge:
+                # Merging loads referenced models, which would otherwise autoflush (and
+                # therefore remove from `session.new`) the previously merged models.
+                with session.no_autoflush:
+                    models = [session.merge(model) for model in models]
+            else:
+                session.add_all(models)
+
+            flushed = list(session.new)
+            session.commit()
+
+            if refresh in ("eager", "batch"):
+                getattr(self.manager, f"_refresh_{refresh}")(models, session=session)
+            return models, flushed
+        finally:
+            session.close()
+
+    def created(self, model_cls=None):
+        return self.manager.created(model_cls)
+
+    def created_count(self, model_cls=None):
+        return self.manager.created_count(model_cls)
+
+    def stats(self):
+        return self.manager.stats()
+
+
+def _single_connection(engine) -> bool:
+    """Whether every checkout of `engine`'s pool (within a process) shares one connection."""
+    if isinstance(engine.pool, (StaticPool, SingletonThreadPool)):
+        return True
+
+    url = engine.url
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
@@ -0,0 +1,247 @@
+"""Record where the time (and SQL) of factory calls is spent, when the `profile` option is set."""
+import contextlib
+import time
+import tracemalloc
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import event
+
+
+class FactoryStats:
+    """Accumulate the cost of the calls to one factory.
+
+    `time` is the total wall time of the calls, of which `user_time` was spent in the
+    factory function itself, and the remainder (`add_result_time`) in adding the results
+    to the session (i.e. flushing, committing and refreshing).
+
+    When memory is profiled, `allocated` is the net number of bytes allocated by the calls
+    (and still held after them), and `blocks` the net number of memory blocks (roughly,
+    objects) allocated.
+
+    Examples:
+        >>> stats = FactoryStats("foo.new")
+        >>> stats.calls, stats.time, stats.user_time = 2, 0.5, 0.125
+        >>> stats.add_result_time
+        0.375
+
+        >>> total = FactoryStats("foo.new")
+        >>> total.merge(stats)
+        >>> total.merge(stats)
+        >>> total
+        FactoryStats(foo.new, calls=4, time=1.0000s, user_time=0.2500s, statements=0, flushes=0, refreshes=0, allocated=0, blocks=0)
+    """
+
+    __slots__ = (
+        "name",
+        "calls",
+        "time",
+        "user_time",
+        "statements",
+        "flushes",
+        "refreshes",
+        "allocated",
+        "blocks",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.time = 0.0
+        self.user_time = 0.0
+        self.statements = 0
+        self.flushes = 0
+        self.refreshes = 0
+        self.allocated = 0
+        self.blocks = 0
+
+    @property
+    def add_result_time(self) -> float:
+        return self.time - self.user_time
+
+    def merge(self, other: "FactoryStats"):
+        """Add the counters of `other` to this `FactoryStats`."""
+        self.calls += other.calls
+        self.time += other.time
+        self.user_time += other.user_time
+        self.statements += other.statements
+        self.flushes += other.flushes
+        self.refreshes += other.refreshes
+        self.allocated += other.allocated
+        self.blocks += other.blocks
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.name}, calls={self.calls}, "
+            f"time={self.time:.4f}s, user_time={self.user_time:.4f}s, "
+            f"statements={self.statements}, flushes={self.flushes}, "
+            f"refreshes={self.refreshes}, allocated={self.allocated}, "
+            f"blocks={self.blocks})"
+        )
+
+
+class Profiler:
+    """Attribute the statements, flushes and time of a `ModelFactory` to its factories.
+
+    Statements and flushes are attributed to whichever factory call (or the cleanup)
+    is in progress when they occur. Those occurring outside of any are not recorded.
+
+    When `memory` is set, a tracemalloc snapshot is taken before and after each call, and
+    the difference is attributed to the call. This is slow, and the time spent taking the
+    snapshots is included in the recorded times.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.stats: Dict[str, FactoryStats] = {}
+        self.cleanup = FactoryStats("<cleanup>")
+
+        self._stack: List[FactoryStats] = []
+        self._engine = None
+        self._started_tracing = False
+
+    def start(self, session):
+        self._engine = session.get_bind().engine
+        event.listen(self._engine, "before_cursor_execute", self._count_statement)
+        event.listen(session, "after_flush", self._count_flush)
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self, session):
+        event.remove(self._engine, "before_cursor_execute", self._count_statement)
+        event.remove(session, "after_flush", self._count_flush)
+        self._engine = None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def factory(self, name: str) -> FactoryStats:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = FactoryStats(name)
+        return stats
+
+    @contextlib.contextmanager
+    def track(self, stats: FactoryStats):
+        """Attribute everything which occurs inside the block, to `stats`."""
+        stats.calls += 1
+        self._stack.append(stats)
+
+        before = self._snapshot() if self.memory else None
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.time += time.perf_counter() - start
+            self._stack.pop()
+
+            if before is not None:
+                after = self._snapshot()
+                if after is not None:
+                    for difference in after.compare_to(before, "filename"):
+                        stats.allocated += difference.size_diff
+                        stats.blocks += difference.count_diff
+
+    def _snapshot(self) -> Optional[tracemalloc.Snapshot]:
+        if not tracemalloc.is_tracing():
+            return None
+
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+
+    def count_refreshes(self, count: int):
+        current = self._current()
+        if current is not None:
+            current.refreshes += count
+
+    def _current(self) -> Optional[FactoryStats]:
+        return self._stack[-1] if self._stack else None
+
+    def _count_statement(self, *_):
+        current = self._current()
+        if current is not None:
+            current.statements += 1
+
+    def _count_flush(self, *_):
+        current = self._current()
+        if current is not None:
+            current.flushes += 1
+
+
+def format_stats(
+    stats: Iterable[FactoryStats], memory: bool = False, limit: Optional[int] = None
+) -> List[str]:
+    """Format `stats` as the lines of a table, slowest (or with `memory`, largest) first.
+
+    Examples:
+        >>> stats = FactoryStats("foo.new")
+        >>> stats.calls, stats.time, stats.allocated, stats.blocks = 2, 0.5, 2048, 10
+        >>> for line in format_stats([stats], memory=True):
+        ...     print(line)
+        factory                                     calls     total      user       add    stmts  flushes  refresh  allocated   blocks
+        foo.new                                         2    0.500s    0.000s    0.500s        0        0        0     2.0KiB       10
+    """
+    key = (lambda s: s.allocated) if memory else (lambda s: s.time)
+    ordered = sorted(stats, key=key, reverse=True)[:limit]
+
+    header = (
+        f"{'factory':<40} {'calls':>8} {'total':>9} {'user':>9} {'add':>9} "
+        f"{'stmts':>8} {'flushes':>8} {'refresh':>8}"
+    )
+    if memory:
+        header += f" {'allocated':>10} {'blocks':>8}"
+
+    lines = [header]
+    for item in ordered:
+        line = (
+            f"{item.name:<40} {item.calls:>8} {item.time:>8.3f}s "
+            f"{item.user_time:>8.3f}s {item.add_result_time:>8.3f}s "
+            f"{item.statements:>8} {item.flushes:>8} {item.refreshes:>8}"
+        )
+        if memory:
+            line += f" {format_bytes(item.allocated):>10} {item.blocks:>8}"
+        lines.append(line)
+    return lines
+
+
+def format_bytes(size: int) -> str:
+    """Format a number of bytes for humans.
+
+    Examples:
+        >>> format_bytes(512), format_bytes(-2048), format_bytes(5 * 1024 ** 2)
+        ('512B', '-2.0KiB', '5.0MiB')
+    """
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
+
+
+def parse_bytes(value: str) -> int:
+    """Parse a number of bytes, with an optional (binary) unit suffix.
+
+    Examples:
+        >>> parse_bytes("1024"), parse_bytes("10K"), parse_bytes("5MB"), parse_bytes("1 GiB")
+        (1024, 10240, 5242880, 1073741824)
+
+        >>> parse_bytes("lots")
+        Traceback (most recent call last):
+        ValueError: Invalid number of bytes: 'lots'
+    """
+    text = value.strip().upper().replace("IB", "").rstrip("B").strip()
+    multiplier = 1
+    for power, suffix in enumerate(("K", "M", "G"), start=1):
+        if text.endswith(suffix):
+            text = text[:-1].strip()
+            multiplier = 1024**power
+            break
+
+    try:
+        return int(float(text) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid number of bytes: {value!r}")
@@ -4,10 +4,32 @@ General usage requires the user to define either a `mf_engine` or a `mf_session`
 Once defined, they can have their tests depend on the exposed `mf` fixture, which should
 give them access to any factory functions on which they've called `register_at`.
 """
-from sqlalchemy import create_engine
+import atexit
+import copy
+import os
+import shutil
+import sqlite3
+import tempfile
+import weakref
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm.session import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy_model_factory.asyncio import AsyncModelFactory
 from sqlalchemy_model_factory.base import ModelFactory
+from sqlalchemy_model_factory.cleanup import enable_sqlite_savepoints
+from sqlalchemy_model_factory.profiling import (
+    FactoryStats,
+    format_bytes,
+    format_stats,
+    parse_bytes,
+    Profiler,
+)
 from sqlalchemy_model_factory.registry import registry, Registry
+from sqlalchemy_model_factory.utils import worker_id
 
 try:
     import pytest
@@ -19,7 +41,9 @@ except ImportError:
         The below function will simply act as a normal function if pytest is not installed.
         """
 
-        def fixture(fn):
+        def fixture(fn=None, **kwargs):
+            if fn is None:
+                return lambda fn: fn
             return fn
 
 
@@ -35,21 +59,395 @@ def create_registry_fixture(factory_or_registry):
     return pytest.fixture(fixture)
 
 
+_created_schemas: "weakref.WeakKeyDictionary[Engine, Set[int]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_schema(bind, metadata):
+    """Create the schema for the given `metadata`, once per engine.
+
+    Subsequent calls with the same engine (or a connection of it) and metadata do nothing,
+    so that the (comparatively slow) schema creation is not repeated for every test.
+    """
+    if metadata is None:
+        return
+
+    if isinstance(metadata, MetaData):
+        metadata = [metadata]
+
+    created = _created_schemas.setdefault(bind.engine, set())
+    for item in metadata:
+        if id(item) in created:
+            continue
+
+        item.create_all(bind)
+        created.add(id(item))
+
+
+class SqliteTemplate:
+    """Build a SQLite database once, and produce cheap copies of it.
+
+    The schema for `metadata` is created (and the database seeded, through the optional `seed`
+    callable, which is given a `Session`) once, into a template database. Each call to `clone`
+    then produces an engine for a fresh copy of that template.
+
+    Copying an already populated database is far cheaper than creating the schema and seeding
+    it again, and each copy is discarded after use, so no cleanup is required at all.
+
+    Args:
+        metadata: The `MetaData` (or list of them) whose schema should be created.
+        seed: An optional callable, given a `Session`, with which to populate the template.
+        on_disk: When `False` (the default), the template and its copies are held in memory,
+            and copied through `sqlite3.Connection.backup`. When `True`, they are files, and
+            copied with a reflink where supported by the filesystem (or a regular copy otherwise).
+    """
+
+    def __init__(self, metadata, seed=None, on_disk=False):
+        self.metadata = [metadata] if isinstance(metadata, MetaData) else metadata
+        self.seed = seed
+        self.on_disk = on_disk
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._directory: Optional[str] = None
+        self._path: Optional[str] = None
+
+    def build(self):
+        if self._connection is not None or self._path is not None:
+            return
+
+        if self.on_disk:
+            self._directory = tempfile.mkdtemp()
+            self._path = os.path.join(self._directory, "template.sqlite")
+            engine = create_engine(f"sqlite:///{self._path}")
+
+            # The template outlives any one test, so it's removed when the process exits.
+            atexit.register(self.close)
+        else:
+            self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+            engine = self._engine_for(self._connection)
+
+        for metadata in self.metadata:
+            metadata.create_all(engine)
+
+        if self.seed:
+            session = sessionmaker(engine)()
+            try:
+                self.seed(session)
+                session.commit()
+            finally:
+                session.close()
+
+        if self.on_disk:
+            engine.dispose()
+
+    def close(self):
+        """Discard the template database (it is rebuilt, if subsequently cloned)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+            self._path = None
+
+    def clone(self, directory=None) -> Engine:
+        """Produce an engine for a fresh copy of the template database.
+
+        With `on_disk`, the copy is written into `directory`, which defaults to a new
+        temporary directory (which is then the caller's to remove).
+        """
+        self.build()
+
+        if self.on_disk:
+            assert self._path is not None
+            directory = directory or tempfile.mkdtemp()
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, "test.sqlite")
+            _copy_file(self._path, path)
+            engine = create_engine(f"sqlite:///{path}")
+        else:
+            assert self._connection is not None
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            self._connection.backup(connection)
+            engine = self._engine_for(connection)
+
+        enable_sqlite_savepoints(engine)
+
+        # The copy already has the schema, there's no need for `mf_session` to create it.
+        created = _created_schemas.setdefault(engine, set())
+        created.update(id(metadata) for metadata in self.metadata)
+        return engine
+
+    @staticmethod
+    def _engine_for(connection):
+        return create_engine(
+            "sqlite://", creator=lambda: connection, poolclass=StaticPool
+        )
+
+
+def _copy_file(source, destination):
+    """Copy a file, preferring a (copy-on-write) reflink, where the filesystem supports it."""
+    try:
+        import fcntl
+
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+
+    shutil.copyfile(source, destination)
+
+
+# The Linux ioctl request number for cloning a file's extents (i.e. a reflink).
+_FICLONE = 0x40049409
+
+
+def create_template_engine_fixture(metadata, seed=None, on_disk=False):
+    """Produce a `mf_engine` fixture which gives each test a fresh copy of a template database.
+
+    See `SqliteTemplate` for details.
+
+    Examples:
+        >>> from sqlalchemy import MetaData
+        >>> def seed(session):
+        ...     ...
+
+        >>> mf_engine = create_template_engine_fixture(MetaData(), seed=seed)
+    """
+    template = SqliteTemplate(metadata, seed=seed, on_disk=on_disk)
+
+    def fixture(tmp_path):
+        engine = template.clone(str(tmp_path))
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+
+    return pytest.fixture(fixture)
+
+
 @pytest.fixture
 def mf_registry():
     """Define a default fixture for the general case where the default registry is used."""
     return registry
 
 
+def pytest_addoption(parser):
+    parser.addini(
+        "mf_database_url",
+        "The database URL used by the default `mf_engine` fixture. May include a "
+        "`{worker_id}` placeholder, which is replaced by the pytest-xdist worker id.",
+        default="sqlite://",
+    )
+    parser.addoption(
+        "--mf-profile",
+        action="store_true",
+        default=False,
+        help="Profile the factories used through the `mf` fixture, and summarize the "
+        "slowest factories and cleanups.",
+    )
+    parser.addoption(
+        "--mf-profile-memory",
+        action="store_true",
+        default=False,
+        help="Profile the memory allocated by the factories used through the `mf` fixture "
+        "(with tracemalloc), and summarize the largest.",
+    )
+    parser.addoption(
+        "--mf-memory-budget",
+        type=parse_bytes,
+        default=None,
+        help="With --mf-profile-memory, flag tests whose factories allocate more than this "
+        "many bytes (i.e. 50M).",
+    )
+
+
+def pytest_configure(config):
+    profile = config.getoption("mf_profile", default=False)
+    memory = config.getoption("mf_profile_memory", default=False)
+    if profile or memory:
+        config._mf_profile = ProfileReport(
+            memory=memory,
+            budget=config.getoption("mf_memory_budget", default=None),
+        )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    report = getattr(config, "_mf_profile", None)
+    if report is not None:
+        report.write(terminalreporter)
+
+
+class ProfileReport:
+    """Aggregate the `FactoryStats` recorded by the `mf` fixture, under `--mf-profile`.
+
+    With `memory` (`--mf-profile-memory`), the tests whose factories allocated more than
+    the `budget` (`--mf-memory-budget`) are additionally reported.
+    """
+
+    def __init__(
+        self, limit: int = 10, memory: bool = False, budget: Optional[int] = None
+    ):
+        self.limit = limit
+        self.memory = memory
+        self.budget = budget
+        self.factories: Dict[str, FactoryStats] = {}
+        self.cleanups: List[Tuple[str, FactoryStats]] = []
+        self.allocations: List[Tuple[str, int]] = []
+
+    def add(self, nodeid: str, profiler: Profiler):
+        for name, stats in profiler.stats.items():
+            total = self.factories.get(name)
+            if total is None:
+                total = self.factories[name] = FactoryStats(name)
+            total.merge(stats)
+
+        self.cleanups.append((nodeid, profiler.cleanup))
+        self.allocations.append(
+            (nodeid, sum(stats.allocated for stats in profiler.stats.values()))
+        )
+
+    def over_budget(self) -> List[Tuple[str, int]]:
+        if not self.memory or self.budget is None:
+            return []
+
+        over = [item for item in self.allocations if item[1] > self.budget]
+        return sorted(over, key=lambda item: item[1], reverse=True)
+
+    def write(self, terminalreporter):
+        terminalreporter.write_sep("=", "model factory profile")
+
+        lines = format_stats(
+            self.factories.values(), memory=self.memory, limit=self.limit
+        )
+        for line in lines:
+            terminalreporter.write_line(line)
+
+        terminalreporter.write_line("")
+        cleanups = sorted(self.cleanups, key=lambda item: item[1].time, reverse=True)
+        terminalreporter.write_line(f"{'cleanup':<70} {'total':>9} {'stmts':>8}")
+        for nodeid, stats in cleanups[: self.limit]:
+            terminalreporter.write_line(
+                f"{nodeid:<70} {stats.time:>8.3f}s {stats.statements:>8}"
+            )
+
+        over_budget = self.over_budget()
+        if over_budget:
+            terminalreporter.write_line("")
+            terminalreporter.write_line(
+                f"tests over the factory memory budget of {format_bytes(self.budget)}:",
+                red=True,
+            )
+            for nodeid, allocated in over_budget:
+                terminalreporter.write_line(
+                    f"{nodeid:<70} {format_bytes(allocated):>10}"
+                )
+
+
+@pytest.fixture(scope="session")
+def mf_worker_id():
+    """Define a fixture for the pytest-xdist worker id ("master" when not running under xdist)."""
+    return worker_id()
+
+
+@pytest.fixture(scope="session")
+def mf_database_url(request, mf_worker_id):
+    """Define a default fixture for the database URL used by the default `mf_engine`.
+
+    Defaults to the `mf_database_url` ini option, with any `{worker_id}` placeholder replaced
+    with the pytest-xdist worker id, such that each worker gets its own database.
+    """
+    url_template = request.config.getini("mf_database_url")
+    return url_template.format(worker_id=mf_worker_id)
+
+
+@pytest.fixture(scope="session")
+def mf_engine(mf_database_url):
+    """Define a default fixture in for the database engine.
+
+    The engine is shared by the whole test session (and thus, per pytest-xdist worker).
+    By default, it's an in-memory SQLite database, whose single connection is shared amongst
+    the tests through a `StaticPool`. SQLite engines are configured to support SAVEPOINTs
+    (such that the "rollback" cleanup option works).
+    """
+    url = make_url(mf_database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        engine = create_engine(
+            url, poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+    else:
+        provision_database(url)
+        engine = create_engine(url)
+
+    if url.get_backend_name() == "sqlite":
+        enable_sqlite_savepoints(engine)
+
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def provision_database(url):
+    """Ensure the database at `url` exists, creating it if necessary.
+
+    * sqlite: The directory for the database file is created.
+    * postgresql: The database is created (through the "postgres" maintenance database).
+    * otherwise: The database is assumed to exist.
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        directory = os.path.dirname(url.database or "")
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return
+
+    if backend == "postgresql":
+        maintenance_url = _set_database(url, "postgres")
+        engine = create_engine(maintenance_url, isolation_level="AUTOCOMMIT")
+        try:
+            with engine.connect() as connection:
+                exists = connection.execute(
+                    text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                    {"name": url.database},
+                ).scalar()
+                if not exists:
+                    quote = engine.dialect.identifier_preparer.quote
+                    connection.execute(text(f"CREATE DATABASE {quote(url.database)}"))
+        finally:
+            engine.dispose()
+
+
+def _set_database(url, database):
+    # `URL` is immutable as of SQLAlchemy 1.4.
+    if hasattr(url, "set"):
+        return url.set(database=database)
+
+    url = copy.copy(url)
+    url.database = database
+    return url
+
+
 @pytest.fixture
-def mf_engine():
-    """Define a default fixture in for the database engine."""
-    return create_engine("sqlite:///")
+def mf_metadata():
+    """Define a default fixture for the `MetaData` whose schema should be created.
+
+    When overridden to return a `MetaData` (or a list of them), the schema is created
+    in the `mf_engine` database once, before it's first used by the `mf_session`.
+    """
+    return None
 
 
 @pytest.fixture
-def mf_session(mf_engine):
+def mf_session(mf_engine, mf_metadata):
     """Define a default fixture in for the session, in case the user defines only `mf_engine`."""
+    create_schema(mf_engine, mf_metadata)
+
     Session = sessionmaker(mf_engine)
     session = Session()
     try:
@@ -65,7 +463,60 @@ def mf_config():
 
 
 @pytest.fixture
-def mf(mf_registry, mf_session, mf_config):
+def mf(request, mf_registry, mf_session, mf_config):
     """Define a fixture for use of the ModelFactory in tests."""
-    with ModelFactory(mf_registry, mf_session, options=mf_config) as model_manager:
+    report = getattr(request.config, "_mf_profile", None)
+    if report is not None:
+        mf_config = {
+            **(mf_config or {}),
+            "profile": True,
+            "profile_memory": report.memory,
+        }
+
+    manager = ModelFactory(mf_registry, mf_session, options=mf_config)
+    with manager as model_manager:
+        yield model_manager
+
+    if report is not None:
+        report.add(request.node.nodeid, manager.profiler)
+
+
+@pytest.fixture
+async def mf_async_engine():
+    """Define a default fixture for the `AsyncEngine`, used by the `mf_async` fixture.
+
+    This requires the `aiosqlite` driver. The asynchronous fixtures require an async-aware
+    pytest plugin (such as pytest-asyncio, in "auto" mode, or anyio).
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    enable_sqlite_savepoints(engine.sync_engine)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def mf_async_session(mf_async_engine, mf_metadata):
+    """Define a default fixture for the `AsyncSession`, in case the user defines only `mf_async_engine`."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with mf_async_engine.begin() as connection:
+        await connection.run_sync(create_schema, mf_metadata)
+
+    session = AsyncSession(mf_async_engine, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+@pytest.fixture
+async def mf_async(mf_registry, mf_async_session, mf_config):
+    """Define a fixture for use of the AsyncModelFactory in (async) tests."""
+    async with AsyncModelFactory(
+        mf_registry, mf_async_session, options=mf_config
+    ) as model_manager:
         yield model_manager
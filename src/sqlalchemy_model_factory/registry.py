@@ -1,10 +1,31 @@
-from typing import Callable, Generic, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy_model_factory.hooks import Hooks
+
+# Classes are valid keys, but are not considered `Hashable` by mypy.
+CacheKey = Union[Hashable, type]
 
 
 class Registry:
     def __init__(self):
         self._registered_methods = {}
 
+        # Incremented upon any change to the registered methods, invalidating `cached` values.
+        self.version = 0
+        self._cache: Dict[CacheKey, Tuple[int, Any]] = {}
+
+        self.hooks = Hooks()
+
     def namespaces(self):
         return list(self._registered_methods)
 
@@ -13,6 +34,52 @@ class Registry:
 
     def clear(self):
         self._registered_methods = {}
+        self.version += 1
+
+    def listen(self, event: str, fn: Callable):
+        """Call `fn` with a `FactoryEvent` upon each `event`, for every `ModelFactory` of this registry.
+
+        See `sqlalchemy_model_factory.hooks.EVENTS` for the available events.
+        """
+        self.hooks.listen(event, fn)
+
+    def remove_listener(self, event: str, fn: Callable):
+        self.hooks.remove(event, fn)
+
+    def listens_for(self, event: str):
+        """Decorate a function to `listen` for the given `event`.
+
+        Examples:
+            >>> registry = Registry()
+            >>> @registry.listens_for("after_call")
+            ... def on_call(event):
+            ...     pass
+        """
+
+        def decorator(fn):
+            self.listen(event, fn)
+            return fn
+
+        return decorator
+
+    def cached(self, key: CacheKey, build: Callable[["Registry"], Any]):
+        """Return the result of `build(registry)`, only rebuilding it when the registry changes.
+
+        Examples:
+            >>> registry = Registry()
+            >>> registry.cached("names", lambda r: r.namespaces())
+            []
+
+            >>> registry.register_at("foo")(lambda: 1)  # doctest: +ELLIPSIS
+            <function <lambda> at ...>
+            >>> registry.cached("names", lambda r: r.namespaces())
+            [('foo',)]
+        """
+        version, value = self._cache.get(key, (None, None))
+        if version != self.version:
+            value = build(self)
+            self._cache[key] = (self.version, value)
+        return value
 
     def register_at(
         self,
@@ -20,6 +87,7 @@ class Registry:
         name="new",
         merge: Optional[bool] = None,
         commit: Optional[bool] = None,
+        refresh: Optional[str] = None,
     ):
         def wrapper(fn):
             registry_namespace = self._registered_methods.setdefault(namespace_path, {})
@@ -32,9 +100,13 @@ class Registry:
 
             method = fn
             if not isinstance(fn, Method):
-                method = Method(fn, merge=merge, commit=commit)
+                method = Method(fn, merge=merge, commit=commit, refresh=refresh)
+
+            # Resolve everything that can be, once, rather than upon every call.
+            method.plan = CallPlan.compile(method, path=(*namespace_path, name))
 
             registry_namespace[name] = method
+            self.version += 1
             return fn
 
         return wrapper
@@ -49,10 +121,13 @@ class Method(Generic[R]):
         fn: Callable[..., R],
         commit: Optional[bool] = None,
         merge: Optional[bool] = None,
+        refresh: Optional[str] = None,
     ):
         self.fn = fn
         self.commit = commit
         self.merge = merge
+        self.refresh = refresh
+        self.plan: Optional[CallPlan] = None
 
     def __repr__(self):
         result = f"{self.__class__.__name__}({self.fn}"
@@ -61,6 +136,9 @@ class Method(Generic[R]):
 
         if self.merge is not None:
             result += f", merge={self.merge}"
+
+        if self.refresh is not None:
+            result += f", refresh={self.refresh!r}"
         result += ")"
         return result
 
@@ -68,5 +146,130 @@ class Method(Generic[R]):
         return self.fn(*args, **kwargs)
 
 
+class CallPlan:
+    """Hold the precompiled, immutable details required to call a registered `Method`.
+
+    Examples:
+        >>> from sqlalchemy_model_factory.utils import for_model
+        >>> @for_model(dict)
+        ... def new(a):
+        ...     return {"a": a}
+
+        >>> plan = CallPlan.compile(Method(new, merge=True), path=("foo", "new"))
+        >>> plan
+        CallPlan(foo.new, commit=True, merge=True, refresh=None, for_model=True)
+        >>> plan.target(1)
+        {'a': 1}
+
+        Factories with `for_model(..., core=True)` also hold the uncoerced function, which
+        produces the mappings to insert.
+
+        >>> @for_model(dict, core=True)
+        ... def new(a):
+        ...     return {"a": a}
+        >>> plan = CallPlan.compile(Method(new), path=("foo", "new"))
+        >>> plan
+        CallPlan(foo.new, commit=True, merge=False, refresh=None, for_model=True, core=True)
+        >>> plan.mapping is new, plan.model
+        (True, <class 'dict'>)
+    """
+
+    __slots__ = (
+        "target",
+        "commit",
+        "merge",
+        "refresh",
+        "for_model",
+        "path",
+        "model",
+        "mapping",
+        "core",
+    )
+
+    target: Callable
+    commit: bool
+    merge: bool
+    refresh: Optional[str]
+    for_model: bool
+    path: Tuple[str, ...]
+    model: Optional[type]
+    mapping: Optional[Callable]
+    core: bool
+
+    def __init__(
+        self,
+        target: Callable,
+        commit: bool = True,
+        merge: bool = False,
+        refresh: Optional[str] = None,
+        for_model: bool = False,
+        path: Tuple[str, ...] = (),
+        model: Optional[type] = None,
+        mapping: Optional[Callable] = None,
+        core: bool = False,
+    ):
+        object.__setattr__(self, "target", target)
+        object.__setattr__(self, "commit", commit)
+        object.__setattr__(self, "merge", merge)
+        object.__setattr__(self, "refresh", refresh)
+        object.__setattr__(self, "for_model", for_model)
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "model", model)
+        object.__setattr__(self, "mapping", mapping)
+        object.__setattr__(self, "core", core)
+
+    @classmethod
+    def compile(cls, method: "Method", path: Tuple[str, ...] = ()) -> "CallPlan":
+        target: Callable = method.fn
+        coerce: Optional[Callable] = getattr(target, "for_model", None)
+        for_model = coerce is not None
+        model = mapping = None
+        if coerce is not None:
+            mapping = target
+            target = coerce
+            model = getattr(target, "model", None)
+
+        return cls(
+            target,
+            commit=True if method.commit is None else method.commit,
+            merge=False if method.merge is None else method.merge,
+            refresh=method.refresh,
+            for_model=for_model,
+            path=path,
+            model=model,
+            mapping=mapping,
+            core=getattr(target, "core", False),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        # The immutable `__setattr__` precludes the default (slot-assigning) unpickling.
+        return (
+            self.__class__,
+            (
+                self.target,
+                self.commit,
+                self.merge,
+                self.refresh,
+                self.for_model,
+                self.path,
+                self.model,
+                self.mapping,
+                self.core,
+            ),
+        )
+
+    def __repr__(self):
+        result = (
+            f"{self.__class__.__name__}({'.'.join(self.path)}, commit={self.commit}, "
+            f"merge={self.merge}, refresh={self.refresh}, for_model={self.for_model}"
+        )
+        if self.core:
+            result += ", core=True"
+        return result + ")"
+
+
 registry = Registry()
 register_at = registry.register_at
@@ -0,0 +1,158 @@
+"""Lower-level utilities for emitting statements against the tables of produced models."""
+import itertools
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, inspect, tuple_
+from sqlalchemy.orm import ColumnProperty
+
+# The most conservative bound parameter limit amongst the commonly used databases (SQLite < 3.32).
+DEFAULT_MAX_PARAMETERS = 999
+
+
+def max_parameters(dialect) -> int:
+    """Return the number of bound parameters which can safely be sent in one statement."""
+    return (
+        getattr(dialect, "insertmanyvalues_max_parameters", None)
+        or DEFAULT_MAX_PARAMETERS
+    )
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Split `items` into lists of at most `size` items.
+
+    Examples:
+        >>> list(chunked([1, 2, 3, 4, 5], 2))
+        [[1, 2], [3, 4], [5]]
+    """
+    size = max(size, 1)
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def identity_tables(mapper) -> List:
+    """Return the tables of `mapper` whose primary key corresponds to the mapper's identity.
+
+    This is generally a single table, or each of the tables involved in joined
+    table inheritance.
+    """
+    size = len(mapper.primary_key)
+    return [table for table in mapper.tables if len(table.primary_key) == size]
+
+
+def primary_keys_by_table(models: Iterable) -> Dict:
+    """Group the primary key identities of persisted `models` by the tables they occupy.
+
+    Models which have not been persisted (and thus have no identity) are skipped.
+    Models which span multiple tables (i.e. joined table inheritance) are recorded
+    against each of those tables.
+    """
+    result: Dict = {}
+    for model in models:
+        state = inspect(model)
+        identity = state.identity
+        if identity is None:
+            continue
+
+        for table in identity_tables(state.mapper):
+            result.setdefault(table, {})[identity] = None
+    return result
+
+
+def secondary_references(mappers: Iterable, tables: Iterable) -> Dict:
+    """Find the association (`secondary`) table columns which reference the primary key of `tables`.
+
+    Both sides of each many-to-many relationship of the given `mappers` are considered.
+    The result maps each association table to `(referenced table, columns)` pairs, where
+    `columns` are the association table's columns, in the referenced primary key's order.
+    """
+    tables = set(tables)
+    result: Dict = {}
+    for mapper in mappers:
+        for prop in mapper.relationships:
+            if prop.secondary is None:
+                continue
+
+            for pairs in (prop.synchronize_pairs, prop.secondary_synchronize_pairs):
+                references = dict(pairs)
+                table = next(iter(references)).table
+                if table not in tables or set(references) != set(table.primary_key):
+                    continue
+
+                columns = tuple(references[column] for column in table.primary_key)
+                result.setdefault(prop.secondary, {})[table, columns] = None
+
+    return {secondary: list(references) for secondary, references in result.items()}
+
+
+def primary_key_chunks(
+    table, identities: Iterable[Tuple], dialect, columns: Optional[Sequence] = None
+) -> Iterator[Tuple[list, list]]:
+    """Produce `(columns, identities)` chunks, sized to fit the dialect's parameter limit.
+
+    `columns` defaults to the primary key columns of `table`, but may instead name the
+    columns of another table which reference it (in the primary key's order).
+    """
+    columns = list(table.primary_key if columns is None else columns)
+    size = max_parameters(dialect) // len(columns)
+    for chunk in chunked(identities, size):
+        yield columns, chunk
+
+
+def primary_key_in(columns, identities):
+    """Produce a clause matching rows whose primary key is one of the given `identities`."""
+    if len(columns) == 1:
+        return columns[0].in_([identity[0] for identity in identities])
+    return tuple_(*columns).in_(identities)
+
+
+def column_keys(mapper, keys: Iterable[str]) -> Dict[str, str]:
+    """Map the attribute `keys` of `mapper` to the keys of the columns they correspond to.
+
+    Examples:
+        >>> from sqlalchemy import Column, types
+        >>> from sqlalchemy.ext.declarative import declarative_base
+        >>> class Model(declarative_base()):
+        ...     __tablename__ = "model"
+        ...     id = Column(types.Integer(), primary_key=True)
+        ...     name = Column("full_name", types.Unicode())
+
+        >>> column_keys(inspect(Model), ["id", "name"])
+        {'id': 'id', 'name': 'full_name'}
+
+        >>> column_keys(inspect(Model), ["wat"])
+        Traceback (most recent call last):
+        ValueError: 'wat' is not a column attribute of Model, and so cannot be inserted directly.
+    """
+    result = {}
+    for key in keys:
+        prop = mapper.attrs.get(key)
+        if not isinstance(prop, ColumnProperty) or len(prop.columns) != 1:
+            raise ValueError(
+                f"{key!r} is not a column attribute of {mapper.class_.__name__}, and so "
+                "cannot be inserted directly."
+            )
+        result[key] = prop.columns[0].key
+    return result
+
+
+def insert_identities(session, table, rows: Sequence[Mapping]) -> List[Tuple]:
+    """Insert `rows` into `table`, returning the primary key identity of each row, in order.
+
+    Where the dialect can return the primary keys of an executemany through RETURNING, in
+    the order of the rows, the rows are inserted with a single executemany. Otherwise (as
+    RETURNING rows are not otherwise guaranteed to be ordered), each row is inserted in turn.
+    """
+    statement = insert(table)
+    columns = list(table.primary_key)
+    dialect = session.get_bind().dialect
+
+    ordered = "insert_executemany_returning_sort_by_parameter_order"
+    if len(rows) > 1 and getattr(dialect, ordered, False):
+        statement = statement.returning(*columns, sort_by_parameter_order=True)
+        return [tuple(row) for row in session.execute(statement, rows)]
+
+    return [tuple(session.execute(statement, row).inserted_primary_key) for row in rows]
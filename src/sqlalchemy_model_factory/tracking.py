@@ -0,0 +1,271 @@
+"""Keep track of the models produced by a `ModelFactory`."""
+from array import array
+from typing import Dict, Iterator, List, Optional, Set, Type
+
+from sqlalchemy import inspect
+from sqlalchemy_model_factory.sql import identity_tables, primary_keys_by_table
+
+
+class ModelTracker:
+    """Record produced models, indexed by their class, in the order they were produced.
+
+    Recording a model is O(1), and a given model is only ever recorded once.
+
+    Rows inserted without producing a model (i.e. through `core_` inserts) are recorded
+    by their primary key identity, and are included in `created` as such.
+
+    Examples:
+        >>> class Foo:
+        ...     pass
+        >>> class Bar:
+        ...     pass
+
+        >>> foo1, foo2, bar = Foo(), Foo(), Bar()
+        >>> tracker = ModelTracker()
+        >>> tracker.add_all([foo1, bar, foo2, foo1])
+
+        >>> len(tracker)
+        3
+        >>> tracker.created(Foo) == [foo1, foo2]
+        True
+        >>> tracker.count(Bar)
+        1
+    """
+
+    def __init__(self):
+        self._models_by_class: Dict[type, Dict[int, object]] = {}
+        self._identities = PrimaryKeyTracker()
+        self._count = 0
+
+    def add(self, model):
+        models = self._models_by_class.setdefault(type(model), {})
+
+        key = id(model)
+        if key not in models:
+            models[key] = model
+            self._count += 1
+
+    def add_all(self, models):
+        for model in models:
+            self.add(model)
+
+    def add_identity(self, cls: type, identity):
+        self._identities.add_identity(cls, identity)
+        self._count += 1
+
+    def created(self, cls: Optional[Type] = None) -> List:
+        """Return the recorded models which are instances of `cls` (or all models, if omitted)."""
+        return list(self._iter(cls)) + self._identities.created(cls)
+
+    def count(self, cls: Optional[Type] = None) -> int:
+        """Return the number of recorded models which are instances of `cls` (or all models)."""
+        if cls is None:
+            return self._count
+
+        return self._identities.count(cls) + sum(
+            len(models)
+            for model_cls, models in self._models_by_class.items()
+            if issubclass(model_cls, cls)
+        )
+
+    def clear(self):
+        self._models_by_class.clear()
+        self._identities.clear()
+        self._count = 0
+
+    def classes(self) -> Set[type]:
+        """Return the classes of the recorded models."""
+        return set(self._models_by_class) | self._identities.classes()
+
+    def models(self) -> Iterator:
+        """Yield the recorded model instances."""
+        return self._iter()
+
+    def identities_by_table(self) -> Dict:
+        """Group the primary key identities of the recorded models by table."""
+        result = primary_keys_by_table(self._iter())
+        for table, identities in self._identities.identities_by_table().items():
+            table_identities = result.setdefault(table, {})
+            for identity in identities:
+                table_identities[identity] = None
+        return result
+
+    def _iter(self, cls=None) -> Iterator:
+        for model_cls, models in self._models_by_class.items():
+            if cls is None or issubclass(model_cls, cls):
+                yield from models.values()
+
+    def __iter__(self):
+        return self._iter()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, model):
+        return id(model) in self._models_by_class.get(type(model), {})
+
+
+class PrimaryKeyTracker:
+    """Record only the primary key identities of produced models, indexed by their class.
+
+    In contrast to `ModelTracker`, no reference to the models themselves is retained,
+    and (integer) primary keys are stored in compact arrays, such that the memory
+    required to track a large number of models stays small.
+
+    *Note* models must have been flushed (and thus have an identity) when they're added.
+
+    Examples:
+        >>> class Foo:
+        ...     pass
+
+        >>> tracker = PrimaryKeyTracker()
+        >>> tracker.add_identity(Foo, (1,))
+        >>> tracker.add_identity(Foo, (2,))
+        >>> tracker.created(Foo)
+        [(1,), (2,)]
+        >>> len(tracker)
+        2
+    """
+
+    def __init__(self):
+        self._identities_by_class: Dict[type, _IdentityStore] = {}
+        self._count = 0
+
+    def add(self, model):
+        state = inspect(model)
+        if state.identity is None:
+            return
+
+        self.add_identity(state.class_, state.identity)
+
+    def add_all(self, models):
+        for model in models:
+            self.add(model)
+
+    def add_identity(self, cls: type, identity):
+        store = self._identities_by_class.get(cls)
+        if store is None:
+            store = self._identities_by_class[cls] = _IdentityStore()
+
+        store.append(identity)
+        self._count += 1
+
+    def created(self, cls: Optional[Type] = None) -> List:
+        """Return the recorded identities of instances of `cls` (or all identities, if omitted)."""
+        return [identity for _, identity in self._iter(cls)]
+
+    def count(self, cls: Optional[Type] = None) -> int:
+        """Return the number of recorded instances of `cls` (or all recorded models)."""
+        if cls is None:
+            return self._count
+
+        return sum(
+            len(store)
+            for model_cls, store in self._identities_by_class.items()
+            if issubclass(model_cls, cls)
+        )
+
+    def clear(self):
+        self._identities_by_class.clear()
+        self._count = 0
+
+    def classes(self) -> Set[type]:
+        """Return the classes of the recorded models."""
+        return set(self._identities_by_class)
+
+    def models(self) -> Iterator:
+        """Yield nothing, as no model instances are retained."""
+        return iter(())
+
+    def identities_by_table(self) -> Dict:
+        """Group the recorded primary key identities by table."""
+        result: Dict = {}
+        for cls, store in self._identities_by_class.items():
+            for table in identity_tables(inspect(cls)):
+                result.setdefault(table, []).append(store)
+
+        return {
+            table: _ChainedStores(stores) if len(stores) > 1 else stores[0]
+            for table, stores in result.items()
+        }
+
+    def _iter(self, cls=None) -> Iterator:
+        for model_cls, store in self._identities_by_class.items():
+            if cls is None or issubclass(model_cls, cls):
+                for identity in store:
+                    yield model_cls, identity
+
+    def __iter__(self):
+        return self._iter()
+
+    def __len__(self):
+        return self._count
+
+
+class _IdentityStore:
+    """Store identities, using a compact array for the common single-integer-key case."""
+
+    __slots__ = ("ints", "others")
+
+    def __init__(self):
+        self.ints = array("q")
+        self.others: List = []
+
+    def append(self, identity):
+        if len(identity) == 1 and type(identity[0]) is int:
+            try:
+                self.ints.append(identity[0])
+                return
+            except OverflowError:
+                pass
+        self.others.append(tuple(identity))
+
+    def __iter__(self):
+        for value in self.ints:
+            yield (value,)
+        yield from self.others
+
+    def __len__(self):
+        return len(self.ints) + len(self.others)
+
+
+class _ChainedStores:
+    """Iterate (repeatedly) over the identities of several stores, as though they were one."""
+
+    __slots__ = ("stores",)
+
+    def __init__(self, stores):
+        self.stores = stores
+
+    def __iter__(self):
+        for store in self.stores:
+            yield from store
+
+    def __len__(self):
+        return sum(len(store) for store in self.stores)
+
+
+_TRACKERS = {
+    "object": ModelTracker,
+    "pk": PrimaryKeyTracker,
+}
+
+
+def get_tracker(track: str):
+    """Produce the tracker for a given `track` option value.
+
+    Examples:
+        >>> get_tracker("pk")
+        <...PrimaryKeyTracker object at ...>
+
+        >>> get_tracker("wat")
+        Traceback (most recent call last):
+        ValueError: Unrecognized track option 'wat', expected one of: object, pk
+    """
+    try:
+        tracker = _TRACKERS[track]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Unrecognized track option {track!r}, expected one of: {', '.join(_TRACKERS)}"
+        )
+    return tracker()
@@ -1,15 +1,249 @@
 import functools
 import inspect
+import os
+import threading
+import weakref
 from types import MappingProxyType
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional
 
 
-def autoincrement(fn: Optional[Callable] = None, *, start: int = 1):  # pragma: no cover
+def worker_id() -> str:
+    """Return the identifier of the current pytest-xdist worker, or "master" if not under xdist.
+
+    Examples:
+        >>> from unittest import mock
+        >>> with mock.patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw3"}):
+        ...     worker_id()
+        'gw3'
+
+        >>> with mock.patch.dict(os.environ):
+        ...     _ = os.environ.pop("PYTEST_XDIST_WORKER", None)
+        ...     worker_id()
+        'master'
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def worker_index() -> int:
+    """Return the 0-based index of the current pytest-xdist worker (0 if not under xdist).
+
+    This can be used to partition ranges of unique values between workers.
+
+    Examples:
+        >>> from unittest import mock
+        >>> with mock.patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw3"}):
+        ...     worker_index()
+        3
+
+        >>> with mock.patch.dict(os.environ):
+        ...     _ = os.environ.pop("PYTEST_XDIST_WORKER", None)
+        ...     worker_index()
+        0
+    """
+    if _worker_index is not None:
+        return _worker_index
+
+    identifier = worker_id()
+    if identifier.startswith("gw") and identifier[2:].isdigit():
+        return int(identifier[2:])
+    return 0
+
+
+_worker_index: Optional[int] = None
+
+
+def set_worker_index(index: Optional[int]):
+    """Override the `worker_index` of this process (or with `None`, remove the override).
+
+    For processes which partition unique values between themselves outside of
+    pytest-xdist, such as the workers of a `multiprocessing.Pool`. Existing `autoincrement`
+    sequences are restarted, such that they draw from the new partition.
+
+    Examples:
+        >>> set_worker_index(5)
+        >>> worker_index()
+        5
+        >>> set_worker_index(None)
+    """
+    global _worker_index
+    _worker_index = index
+    reset_autoincrement()
+
+
+# The span of values reserved for each pytest-xdist worker, by default.
+DEFAULT_PARTITION_SIZE = 1_000_000
+
+_sequences: "weakref.WeakSet[AutoincrementSequence]" = weakref.WeakSet()
+
+
+class AutoincrementSequence:
+    """Produce unique, increasing integers, safely across threads and pytest-xdist workers.
+
+    Each pytest-xdist worker draws from its own range of `partition_size` values, starting
+    from `start + worker_index() * partition_size`, such that the workers (which otherwise
+    each produce the same sequence) do not collide.
+
+    Alternatively, an `allocator` can reserve blocks of `block_size` values at a time
+    (i.e. "hi/lo" allocation), for example from a database sequence shared by every
+    process (see `database_allocator`). It is called with `block_size`, and returns the
+    first value of a newly reserved block.
+
+    Examples:
+        >>> sequence = AutoincrementSequence(start=4)
+        >>> next(sequence), next(sequence)
+        (4, 5)
+        >>> position = sequence.position()
+        >>> next(sequence)
+        6
+        >>> sequence.restore(position)
+        >>> next(sequence)
+        6
+        >>> sequence.reset()
+        >>> next(sequence)
+        4
+
+        >>> from unittest import mock
+        >>> with mock.patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw2"}):
+        ...     next(AutoincrementSequence(partition_size=100))
+        201
+
+        >>> blocks = iter([1, 11])
+        >>> sequence = AutoincrementSequence(block_size=10, allocator=lambda size: next(blocks))
+        >>> [next(sequence) for _ in range(12)][-3:]
+        [10, 11, 12]
+    """
+
+    def __init__(
+        self,
+        start: int = 1,
+        partition_size: int = DEFAULT_PARTITION_SIZE,
+        block_size: int = 1000,
+        allocator: Optional[Callable[[int], int]] = None,
+    ):
+        self.start = start
+        self.partition_size = partition_size
+        self.block_size = block_size
+        self.allocator = allocator
+
+        self._lock = threading.Lock()
+        self._next = 0
+        self._end = 0
+        self.reset()
+
+        _sequences.add(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> int:
+        with self._lock:
+            if self.allocator is not None and self._next >= self._end:
+                self._next = self.allocator(self.block_size)
+                self._end = self._next + self.block_size
+
+            value = self._next
+            self._next += 1
+            return value
+
+    def position(self) -> Optional[int]:
+        """Return the next value to be produced, or `None` if drawn from an `allocator`."""
+        if self.allocator is not None:
+            return None
+        return self._next
+
+    def restore(self, position: Optional[int]):
+        """Return the sequence to a `position` previously returned by `position()`.
+
+        Blocks reserved by an `allocator` cannot be given back, so this does nothing for
+        such sequences.
+        """
+        if self.allocator is None and position is not None:
+            with self._lock:
+                self._next = position
+
+    def reset(self):
+        """Restart the sequence from its first value.
+
+        Blocks reserved by an `allocator` cannot be given back, so this instead discards
+        the remainder of the current block.
+        """
+        with self._lock:
+            if self.allocator is None:
+                self._next = self.start + worker_index() * self.partition_size
+            else:
+                self._next = self._end = 0
+
+
+def autoincrement_positions() -> Dict[AutoincrementSequence, Optional[int]]:
+    """Record the current `position` of every `autoincrement` sequence.
+
+    Performed by a `ModelFactory` upon entry, such that it can `restore_autoincrement`
+    upon exit.
+    """
+    return {sequence: sequence.position() for sequence in list(_sequences)}
+
+
+def restore_autoincrement(positions: Dict[AutoincrementSequence, Optional[int]]):
+    """Return the sequences advanced since `positions` were recorded, to those positions.
+
+    Sequences created since are restarted from their first value.
+    """
+    for sequence in list(_sequences):
+        if sequence not in positions:
+            sequence.reset()
+        elif sequence.position() != positions[sequence]:
+            sequence.restore(positions[sequence])
+
+
+def reset_autoincrement():
+    """Restart every `autoincrement` sequence from its first value."""
+    for sequence in list(_sequences):
+        sequence.reset()
+
+
+def database_allocator(bind, sequence) -> Callable[[int], int]:
+    """Reserve blocks of values from the database `sequence`, for an `AutoincrementSequence`.
+
+    The sequence must be defined with an `increment` equal to the `block_size`, such that
+    each value it produces reserves the block of values following it.
+
+    Examples:
+        >>> from sqlalchemy import Sequence
+        >>> ids = Sequence("ids", increment=100)
+
+        >>> @autoincrement(sequence=AutoincrementSequence(  # doctest: +SKIP
+        ...     block_size=100, allocator=database_allocator(engine, ids),
+        ... ))
+        ... def new(autoincrement=1):
+        ...     return autoincrement
+    """
+    from sqlalchemy import select
+
+    def allocate(block_size: int) -> int:
+        with bind.connect() as connection:
+            return connection.execute(select(sequence.next_value())).scalar()
+
+    return allocate
+
+
+def autoincrement(
+    fn: Optional[Callable] = None,
+    *,
+    start: int = 1,
+    partition_size: int = DEFAULT_PARTITION_SIZE,
+    sequence: Optional[AutoincrementSequence] = None,
+):
     """Decorate registered callables to provide them with a source of uniqueness.
 
+    Values are produced by an `AutoincrementSequence`, and so are safe to produce
+    from multiple threads, and do not collide between pytest-xdist workers.
+
     Args:
         fn: The callable
         start: The starting number of the sequence to generate
+        partition_size: The span of values reserved for each pytest-xdist worker
+        sequence: An explicit `AutoincrementSequence` to draw values from, in place
+            of `start` and `partition_size`.
 
     Examples:
         >>> @autoincrement
@@ -27,17 +261,26 @@ def autoincrement(fn: Optional[Callable] = None, *, start: int = 1):  # pragma:
         4
         >>> new()
         5
+
+        The sequence is available as `autoincrement`, and is restarted (along with every
+        other) by `reset_autoincrement`, or returned to recorded positions by
+        `restore_autoincrement`.
+
+        >>> reset_autoincrement()
+        >>> new()
+        4
     """
 
     def wrapper(fn):
-        wrapper.initial = start
+        counter = sequence or AutoincrementSequence(
+            start=start, partition_size=partition_size
+        )
 
         @functools.wraps(fn)
         def decorator(*args, **kwargs):
-            result = fn(*args, autoincrement=wrapper.initial, **kwargs)
-            wrapper.initial += 1
-            return result
+            return fn(*args, autoincrement=next(counter), **kwargs)
 
+        decorator.autoincrement = counter
         return decorator
 
     if fn:
@@ -45,13 +288,18 @@ def autoincrement(fn: Optional[Callable] = None, *, start: int = 1):  # pragma:
     return wrapper
 
 
-def for_model(typ):
+def for_model(typ, core: bool = False):
     """Decorate a factory that returns a `Mapping` type in order to coerce it into the `typ`.
 
     This decorator is only invoked in the context of model factory usage. The intent is that
     a factory function could be more generally useful, such as to create API inputs, that
     also happen to correspond to the creation of a model when invoked during a test.
 
+    When `core` is set (or a call is made with `core_=True`), the mappings are instead
+    inserted directly into the model's table, with no model instances constructed, and
+    the primary key identities of the inserted rows are returned. See
+    `ModelFactory.insert_mappings`.
+
     Examples:
         >>> class Model:
         ...     def __init__(self, **kwargs):
@@ -75,6 +323,8 @@ def for_model(typ):
             result = fn(*args, **kwargs)
             return typ(**result)
 
+        for_model.model = typ
+        for_model.core = core
         fn.for_model = for_model
         return fn
 
@@ -103,36 +353,84 @@ class fluent:
         (a=1, b=6, c=3, args=(), kwargs={})
     """
 
-    def __init__(self, fn, signature=None, pending_args=None):
-        self.fn = fn
-
-        self.signature = signature or inspect.signature(fn)
-        self.pending_args = pending_args or {}
-
-        for parameter in self.signature.parameters.values():
-            if parameter.name == self.bind.__name__:
-                raise ValueError(
-                    f"`fluent` reserves the name {self.bind.__name__}, please choose a different parameter name"
-                )
-
-            if parameter.name in self.pending_args:
-                continue
-
-            setattr(self, parameter.name, self.__apply(parameter))
+    # Each step of a call chain only records its own argument, and refers to the step
+    # before it, such that steps are O(1), and share the structure of the chain before them.
+    __slots__ = ("__plan", "__parent", "__index", "__value", "__supplied")
 
-    def __apply(self, parameter):
-        @functools.wraps(self.fn)
-        def wrapper(*args, **kwargs):
-            signature = inspect.Signature(parameters=[parameter])
-            bound_args = signature.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            return self.__class__(
-                self.fn,
-                self.signature,
-                {**self.pending_args, parameter.name: bound_args.arguments},
-            )
-
-        return wrapper
+    def __init__(self, fn, signature=None, pending_args=None):
+        if signature is None:
+            plan = _FluentPlan.of(fn)
+        else:
+            plan = _FluentPlan(fn, signature)
+
+        self.__plan = plan
+        self.__parent = None
+        self.__index = -1
+        self.__value = None
+        self.__supplied = 0
+        if not pending_args:
+            return
+
+        # The chain is built from a detached root, such that `self` (which takes the place
+        # of the final step) isn't one of its own ancestors.
+        step = object.__new__(self.__class__)
+        step.__plan = plan
+        step.__parent = None
+        step.__index = -1
+        step.__value = None
+        step.__supplied = 0
+        for name, arguments in pending_args.items():
+            step = step.__extend(plan.indexes[name], arguments[name])
+
+        self.__parent = step.__parent
+        self.__index = step.__index
+        self.__value = step.__value
+        self.__supplied = step.__supplied
+
+    @property
+    def fn(self):
+        return self.__plan.fn
+
+    @property
+    def signature(self):
+        return self.__plan.signature
+
+    @property
+    def pending_args(self):
+        names = self.__plan.names
+        return {names[index]: {names[index]: value} for index, value in self.__items()}
+
+    def __getattr__(self, name):
+        # Guard against recursion through the (unset) slots of a partially constructed instance.
+        if name.startswith("_fluent__"):
+            raise AttributeError(name)
+
+        plan = self.__plan
+        index = plan.indexes.get(name)
+        if index is None or self.__supplied >> index & 1:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute '{name}'")
+
+        setter = plan.setters[index]
+
+        def apply(*args, **kwargs):
+            return self.__extend(index, setter(args, kwargs))
+
+        return apply
+
+    def __extend(self, index, value):
+        step = object.__new__(self.__class__)
+        step.__plan = self.__plan
+        step.__parent = self
+        step.__index = index
+        step.__value = value
+        step.__supplied = self.__supplied | 1 << index
+        return step
+
+    def __items(self):
+        step = self
+        while step.__index >= 0:
+            yield step.__index, step.__value
+            step = step.__parent
 
     def bind(
         self,
@@ -151,38 +449,35 @@ class fluent:
                 function call after having called it. If the `call_after` function returns anything,
                 the result of `call_after` will be replaced with the result of the factory function.
         """
-        unsupplied_args = set(self.signature.parameters) - set(self.pending_args)
+        plan = self.__plan
 
-        for arg in unsupplied_args:
-            fn = getattr(self, arg)
-            self = fn()
+        values = list(plan.defaults)
+        for index, value in self.__items():
+            values[index] = value
 
         args: List[Any] = []
         kwargs: Dict[Any, Any] = {}
-
-        for parameter in self.signature.parameters.values():
-            kind_map: Dict[Any, Tuple[Callable, bool]] = {
-                parameter.POSITIONAL_ONLY: (args.append, True),
-                parameter.POSITIONAL_OR_KEYWORD: (args.append, True),
-                parameter.VAR_POSITIONAL: (args.extend, True),
-                parameter.VAR_KEYWORD: (kwargs.update, True),
-                parameter.KEYWORD_ONLY: (kwargs.update, False),
-            }
-
-            pending_arg = self.pending_args[parameter.name]
-
-            update_fn, key_on_param = kind_map[parameter.kind]
-            if key_on_param:
-                update_fn(pending_arg[parameter.name])
+        for index, kind, name in plan.layout:
+            value = values[index]
+            if value is _REQUIRED:
+                # Produces the same error as supplying no arguments to the parameter's setter.
+                value = plan.setters[index]((), {})
+
+            if kind is _POSITIONAL:
+                args.append(value)
+            elif kind is _VAR_POSITIONAL:
+                args.extend(value)
+            elif kind is _KEYWORD:
+                kwargs[name] = value
             else:
-                update_fn(pending_arg)
+                kwargs.update(value)
 
         if call_before:
             call_before_result = call_before(args, MappingProxyType(kwargs))
             if call_before_result:
                 args, kwargs = call_before_result
 
-        result = self.fn(*args, **kwargs)
+        result = plan.fn(*args, **kwargs)
 
         if call_after:
             call_after_result = call_after(result)
@@ -190,3 +485,133 @@ class fluent:
                 return call_after_result
 
         return result
+
+
+_REQUIRED = object()
+
+_POSITIONAL = "positional"
+_VAR_POSITIONAL = "var_positional"
+_KEYWORD = "keyword"
+_VAR_KEYWORD = "var_keyword"
+
+_KINDS = {
+    inspect.Parameter.POSITIONAL_ONLY: _POSITIONAL,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD: _POSITIONAL,
+    inspect.Parameter.VAR_POSITIONAL: _VAR_POSITIONAL,
+    inspect.Parameter.KEYWORD_ONLY: _KEYWORD,
+    inspect.Parameter.VAR_KEYWORD: _VAR_KEYWORD,
+}
+
+
+class _FluentPlan:
+    """Hold everything about a function's signature that `fluent` needs, computed once.
+
+    The plan is cached on the function itself, such that the signature is only inspected
+    the first time a given function is made `fluent`.
+    """
+
+    __slots__ = ("fn", "signature", "names", "indexes", "setters", "defaults", "layout")
+
+    def __init__(self, fn, signature):
+        self.fn = fn
+        self.signature = signature
+
+        parameters = list(signature.parameters.values())
+        for parameter in parameters:
+            if parameter.name == fluent.bind.__name__:
+                raise ValueError(
+                    f"`fluent` reserves the name {fluent.bind.__name__}, please choose a different parameter name"
+                )
+
+        self.names = tuple(parameter.name for parameter in parameters)
+        self.indexes = {name: index for index, name in enumerate(self.names)}
+        self.setters = tuple(_compile_setter(parameter) for parameter in parameters)
+        self.defaults = tuple(_default(parameter) for parameter in parameters)
+        self.layout = tuple(
+            (index, _KINDS[parameter.kind], parameter.name)
+            for index, parameter in enumerate(parameters)
+        )
+
+    @classmethod
+    def of(cls, fn) -> "_FluentPlan":
+        plan = getattr(fn, "_fluent_plan", None)
+
+        # `functools.wraps` copies the plan of a wrapped function onto its wrapper.
+        if plan is None or plan.fn is not fn:
+            plan = cls(fn, inspect.signature(fn))
+            try:
+                fn._fluent_plan = plan
+            except (AttributeError, TypeError):
+                pass
+        return plan
+
+
+def _default(parameter: inspect.Parameter):
+    if parameter.kind is parameter.VAR_POSITIONAL:
+        return ()
+    if parameter.kind is parameter.VAR_KEYWORD:
+        return MappingProxyType({})
+    if parameter.default is parameter.empty:
+        return _REQUIRED
+    return parameter.default
+
+
+def _compile_setter(parameter: inspect.Parameter) -> Callable[[tuple, dict], Any]:
+    """Produce the function which converts the arguments to a parameter's setter into its value.
+
+    The common forms of call are handled directly, and anything else falls back to binding
+    the arguments to a single-parameter signature, which raises the appropriate `TypeError`
+    for invalid calls.
+
+    Examples:
+        >>> def foo(a, *args, b=2, **kwargs):
+        ...     pass
+        >>> a, args, b, kwargs = map(_compile_setter, inspect.signature(foo).parameters.values())
+
+        >>> a((1,), {}), a((), {"a": 1}), args((1, 2), {}), b((), {}), kwargs((), {"c": 3})
+        (1, 1, (1, 2), 2, {'c': 3})
+
+        >>> a((1, 2), {})
+        Traceback (most recent call last):
+        TypeError: too many positional arguments
+    """
+    name = parameter.name
+    kind = parameter.kind
+    default = parameter.default
+    has_default = default is not parameter.empty
+    signature = inspect.Signature(parameters=[parameter])
+
+    def fallback(args, kwargs):
+        bound_args = signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return bound_args.arguments[name]
+
+    if kind is parameter.VAR_POSITIONAL:
+
+        def setter(args, kwargs):
+            return fallback(args, kwargs) if kwargs else args
+
+    elif kind is parameter.VAR_KEYWORD:
+
+        def setter(args, kwargs):
+            return fallback(args, kwargs) if args else kwargs
+
+    else:
+        positional = kind in (
+            parameter.POSITIONAL_ONLY,
+            parameter.POSITIONAL_OR_KEYWORD,
+        )
+        keyword = kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+
+        def setter(args, kwargs):
+            if kwargs:
+                if keyword and not args and len(kwargs) == 1 and name in kwargs:
+                    return kwargs[name]
+            elif len(args) == 1:
+                if positional:
+                    return args[0]
+            elif not args and has_default:
+                return default
+            return fallback(args, kwargs)
+
+    return setter
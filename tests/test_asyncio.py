@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+from sqlalchemy import Column, ForeignKey, types
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy.pool import StaticPool
+from sqlalchemy_model_factory.asyncio import AsyncModelFactory
+from sqlalchemy_model_factory.registry import Registry
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("sqlalchemy.ext.asyncio")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+Base = declarative_base()
+
+
+class Foo(Base):
+    __tablename__ = "foo"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    bar_id = Column(types.Integer(), ForeignKey("bar.id"), nullable=False)
+
+    bar = relationship("Bar", uselist=False, lazy="joined")
+
+
+class Bar(Base):
+    __tablename__ = "bar"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+
+
+registry = Registry()
+
+
+@registry.register_at("foo")
+def new_foo():
+    return Foo(bar=Bar())
+
+
+@registry.register_at("bar")
+def new_bar():
+    return Bar()
+
+
+def run(test, options=None):
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        session = AsyncSession(engine, expire_on_commit=False)
+        try:
+            async with AsyncModelFactory(registry, session, options=options) as mf:
+                await test(mf, session)
+
+            await assert_cleaned_up(session)
+        finally:
+            await session.close()
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+async def count(session, model):
+    result = await session.execute(model.__table__.select())
+    return len(result.fetchall())
+
+
+async def assert_cleaned_up(session):
+    assert await count(session, Foo) == 0
+    assert await count(session, Bar) == 0
+
+
+def test_factory_call():
+    async def test(mf, session):
+        foo = await mf.foo.new()
+        assert foo.id == 1
+        assert foo.bar.id == 1
+
+        assert await count(session, Foo) == 1
+        assert mf.created_count() == 2
+
+    run(test)
+
+
+def test_gather():
+    async def test(mf, session):
+        bars = await asyncio.gather(*[mf.bar.new() for _ in range(5)])
+        assert sorted(bar.id for bar in bars) == [1, 2, 3, 4, 5]
+
+        bars = await mf.bar.new(count_=3)
+        assert len(bars) == 3
+        assert await count(session, Bar) == 8
+
+    run(test)
+
+
+def test_batch():
+    async def test(mf, session):
+        async with mf.batch():
+            bar = await mf.bar.new()
+            assert bar.id is None
+
+        assert bar.id == 1
+
+    run(test)
+
+
+def test_rollback_cleanup():
+    async def test(mf, session):
+        await mf.foo.new(count_=3)
+        assert await count(session, Foo) == 3
+
+    run(test, options={"cleanup": "truncate"})
+
+
+def test_profile_and_hooks():
+    events = []
+    registry.listen("after_call", events.append)
+
+    async def test(mf, session):
+        await mf.foo.new(count_=2)
+        assert mf.stats()["foo.new"].calls == 1
+        assert [(event.path, event.size) for event in events] == [("foo.new", 2)]
+
+        with pytest.raises(TypeError):
+            mf.foo.new.stream(2)
+
+    try:
+        run(test, options={"profile": True})
+    finally:
+        registry.remove_listener("after_call", events.append)
@@ -3,6 +3,7 @@ from sqlalchemy import Column, types
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy_model_factory.base import ModelFactory, Namespace
 from sqlalchemy_model_factory.registry import Method, Registry
+from sqlalchemy_model_factory.utils import for_model
 from tests import get_session
 
 
@@ -42,6 +43,76 @@ class TestNamespace:
         )
 
 
+class TestCallPlan:
+    def test_precompiled_on_registration(self):
+        registry = Registry()
+
+        @registry.register_at("foo", name="bar", merge=True)
+        def bar():
+            return 1
+
+        plan = registry.methods("foo")["bar"].plan
+        assert plan.path == ("foo", "bar")
+        assert plan.commit is True
+        assert plan.merge is True
+        assert plan.target is bar
+
+        with pytest.raises(AttributeError):
+            plan.merge = False
+
+    def test_for_model_applied_after_registration(self):
+        registry = Registry()
+
+        @for_model(dict)
+        @registry.register_at("foo")
+        def new(a):
+            return {"a": a}
+
+        namespace = Namespace.from_registry(registry)
+        assert namespace.foo.new(1) == {"a": 1}
+        assert registry.methods("foo")["new"].plan.for_model is True
+
+
+class TestNamespaceCache:
+    def test_tree_cached_per_registry_version(self):
+        registry = Registry()
+        registry.register_at("foo")(lambda: 1)
+
+        namespace = Namespace.from_registry(registry)
+        assert Namespace.from_registry(registry) is namespace
+
+        registry.register_at("bar")(lambda: 2)
+        namespace2 = Namespace.from_registry(registry)
+        assert namespace2 is not namespace
+        assert namespace2.bar.new() == 2
+
+        registry.clear()
+        with pytest.raises(AttributeError):
+            Namespace.from_registry(registry).foo
+
+    def test_bound_namespace(self):
+        registry = Registry()
+        registry.register_at("foo", "bar")(lambda: 1)
+        registry.register_at("batch")(lambda: 2)
+
+        manager = object()
+        bound = Namespace.from_registry(registry, manager=manager)
+
+        assert bound.foo is bound.foo
+        assert bound.foo.bar._Namespace__manager is manager
+        assert Namespace.from_registry(registry).foo.bar._Namespace__manager is None
+
+        # Registered names take precedence over `Namespace` methods, as when unbound.
+        assert isinstance(bound.batch, Namespace)
+        assert bound.batch._Namespace__manager is manager
+
+        assert repr(bound) == repr(Namespace.from_registry(registry))
+
+        with pytest.raises(AttributeError) as e:
+            bound.wat
+        assert "Available nested namespaces include: foo, batch" in str(e.value)
+
+
 class TestModelFactory:
     Base = declarative_base()
 
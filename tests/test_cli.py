@@ -0,0 +1,169 @@
+import json
+import pickle
+
+import pytest
+from sqlalchemy import Column, create_engine, ForeignKey, types
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
+from sqlalchemy_model_factory.cli import load_registry, main
+from sqlalchemy_model_factory.declarative import declarative
+from sqlalchemy_model_factory.registry import Registry
+from sqlalchemy_model_factory.utils import autoincrement
+
+Base = declarative_base()
+
+
+class Foo(Base):
+    __tablename__ = "foo"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    bar_id = Column(types.Integer(), ForeignKey("bar.id"), nullable=False)
+
+    bar = relationship("Bar", uselist=False)
+
+
+class Bar(Base):
+    __tablename__ = "bar"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    name = Column(types.Unicode(), nullable=True)
+
+
+class User(Base):
+    __tablename__ = "user"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    email = Column(types.Unicode(), nullable=False, unique=True)
+
+
+registry = Registry()
+
+
+@registry.register_at("foo")
+def new_foo():
+    return Foo(bar=Bar())
+
+
+@registry.register_at("bar")
+def new_bar(name=None):
+    return Bar(name=name)
+
+
+@registry.register_at("user")
+@autoincrement
+def new_user(autoincrement=1):
+    return User(email=f"u{autoincrement}@x.com")
+
+
+@declarative
+class ModelFactory:
+    class bar:
+        @staticmethod
+        def new(name=None):
+            return Bar(name=name)
+
+
+def write_scenario(tmp_path, steps):
+    path = tmp_path / "scenario.json"
+    path.write_text(json.dumps(steps))
+    return str(path)
+
+
+def count_rows(url, model):
+    engine = create_engine(url)
+    try:
+        with engine.connect() as connection:
+            return len(connection.execute(model.__table__.select()).fetchall())
+    finally:
+        engine.dispose()
+
+
+class TestSeed:
+    def test_seed(self, tmp_path, capsys):
+        url = f"sqlite:///{tmp_path / 'test.db'}"
+        scenario = write_scenario(
+            tmp_path,
+            [
+                {"factory": "foo.new", "count": 25},
+                {"factory": "bar.new", "kwargs": {"name": "bar"}},
+            ],
+        )
+
+        result = main(
+            [
+                "seed",
+                "tests.test_cli:registry",
+                scenario,
+                "--url",
+                url,
+                "--metadata",
+                "tests.test_cli:Base.metadata",
+                "--chunk-size",
+                "10",
+            ]
+        )
+        assert result == 0
+        assert "Inserted 51 rows" in capsys.readouterr().out
+
+        assert count_rows(url, Foo) == 25
+        assert count_rows(url, Bar) == 26
+
+    def test_seed_workers(self, tmp_path, capsys):
+        url = f"sqlite:///{tmp_path / 'test.db'}"
+        scenario = write_scenario(tmp_path, [{"factory": "bar.new", "count": 9}])
+
+        main(
+            [
+                "seed",
+                "tests.test_cli:ModelFactory",
+                scenario,
+                "--url",
+                url,
+                "--metadata",
+                "tests.test_cli:Base.metadata",
+                "--workers",
+                "2",
+            ]
+        )
+        assert "Inserted 9 rows" in capsys.readouterr().out
+        assert count_rows(url, Bar) == 9
+
+    def test_seed_workers_autoincrement(self, tmp_path, capsys):
+        url = f"sqlite:///{tmp_path / 'test.db'}"
+        scenario = write_scenario(tmp_path, [{"factory": "user.new", "count": 10}])
+
+        result = main(
+            [
+                "seed",
+                "tests.test_cli:registry",
+                scenario,
+                "--url",
+                url,
+                "--metadata",
+                "tests.test_cli:Base.metadata",
+                "--workers",
+                "2",
+            ]
+        )
+        assert result == 0
+        assert "Inserted 10 rows" in capsys.readouterr().out
+        assert count_rows(url, User) == 10
+
+    def test_invalid_registry(self, tmp_path):
+        scenario = write_scenario(tmp_path, [])
+        with pytest.raises(SystemExit):
+            main(["seed", "tests.test_cli:Foo", scenario, "--url", "sqlite://"])
+
+    def test_invalid_scenario(self, tmp_path):
+        scenario = write_scenario(tmp_path, [{"count": 1}])
+        with pytest.raises(SystemExit):
+            main(["seed", "tests.test_cli:registry", scenario, "--url", "sqlite://"])
+
+
+def test_methods_pickle_by_reference():
+    method = load_registry("tests.test_cli:registry").methods("bar")["new"]
+
+    loaded = pickle.loads(pickle.dumps(method))
+    assert loaded.fn is new_bar
+    assert loaded.plan.path == ("bar", "new")
+    assert pickle.loads(pickle.dumps(method.plan)).target is new_bar
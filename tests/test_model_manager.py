@@ -1,10 +1,16 @@
+import gc
+import weakref
+from unittest import mock
+
 import pytest
-from sqlalchemy import Column, ForeignKey, types
+from sqlalchemy import Column, create_engine, event, ForeignKey, Table, types
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from sqlalchemy_model_factory.base import ModelFactory
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy_model_factory.base import ModelFactory, Namespace
+from sqlalchemy_model_factory.cleanup import enable_sqlite_savepoints
 from sqlalchemy_model_factory.registry import registry
-from sqlalchemy_model_factory.utils import for_model
+from sqlalchemy_model_factory.utils import autoincrement, for_model
 from tests import get_session
 
 Base = declarative_base()
@@ -51,6 +57,48 @@ class Baz(Base):
     bar = relationship("Bar")
 
 
+class Thing(Base):
+    __tablename__ = "thing"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+
+
+post_tag = Table(
+    "post_tag",
+    Base.metadata,
+    Column("post_id", types.Integer(), ForeignKey("post.id"), primary_key=True),
+    Column("tag_id", types.Integer(), ForeignKey("tag.id"), primary_key=True),
+)
+
+
+class Post(Base):
+    __tablename__ = "post"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+
+    tags = relationship("Tag", secondary=post_tag)
+
+
+class Tag(Base):
+    __tablename__ = "tag"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+
+
+class Animal(Base):
+    __tablename__ = "animal"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    kind = Column(types.Unicode(), nullable=False)
+
+    __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "animal"}
+
+
+class Dog(Animal):
+    __mapper_args__ = {"polymorphic_identity": "dog"}
+
+
 class TestRegistry:
     def setup(self):
         registry.clear()
@@ -175,6 +223,700 @@ class TestModelFactory:
             assert isinstance(foo, Foo)
 
 
+class TestDeleteCleanup:
+    def setup(self):
+        registry.clear()
+
+    def test_bulk_delete_statements(self):
+        session = get_session(Base)
+
+        @registry.register_at("baz")
+        def new_baz():
+            return Baz(bar=Bar())
+
+        statements = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *_: statements.append(statement),
+        )
+
+        with ModelFactory(registry, session) as mm:
+            mm.baz.new(count_=50)
+            del statements[:]
+
+        deletes = [s for s in statements if s.startswith("DELETE")]
+        assert deletes[0].startswith("DELETE FROM baz")
+        assert deletes[1].startswith("DELETE FROM bar")
+        assert len(deletes) == 2
+
+        assert len(session.query(Bar).all()) == 0
+        assert len(session.query(Baz).all()) == 0
+
+    def test_only_deletes_factory_models(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar()
+
+        with ModelFactory(registry, session) as mm:
+            mm.bar.new()
+
+            session.add(Bar(id=10))
+            session.commit()
+
+        assert [bar.id for bar in session.query(Bar).all()] == [10]
+
+    @pytest.mark.parametrize("track", ["object", "pk"])
+    def test_deletes_association_rows(self, track):
+        engine = create_engine("sqlite:///")
+        event.listen(
+            engine,
+            "connect",
+            lambda dbapi_connection, _: dbapi_connection.execute(
+                "PRAGMA foreign_keys=ON"
+            ),
+        )
+        session = get_session(Base, session=sessionmaker(engine)())
+
+        @registry.register_at("post")
+        def new_post():
+            return Post(tags=[Tag(), Tag()])
+
+        @registry.register_at("tag")
+        def new_tag():
+            return Tag()
+
+        with ModelFactory(registry, session, options={"track": track}) as mm:
+            mm.post.new(count_=3)
+
+            # Associations between an existing post and a produced tag are removed too.
+            existing = Post(id=10)
+            session.add(existing)
+            session.commit()
+            existing.tags.append(mm.tag.new())
+            session.commit()
+
+        assert [post.id for post in session.query(Post).all()] == [10]
+        assert session.query(Tag).count() == 0
+        assert session.execute(post_tag.select()).fetchall() == []
+
+
+class TestTruncateCleanup:
+    def setup(self):
+        registry.clear()
+
+    def test_clears_touched_tables(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar(bar2s=[Bar2()])
+
+        session.add(Baz(bar=Bar(id=100)))
+        session.commit()
+
+        with ModelFactory(registry, session, options={"cleanup": "truncate"}) as mm:
+            mm.bar.new(count_=3)
+
+            # Rows written outside of the factory are also cleared.
+            session.execute(Bar2.__table__.insert().values(id=50, bar_id=100))
+            session.commit()
+
+        assert session.query(Bar2).count() == 0
+        assert session.query(Bar).count() == 0
+
+        # Untouched tables are left alone.
+        assert session.query(Baz).count() == 1
+
+    def test_resets_sqlite_sequence(self):
+        session = get_session(Base)
+
+        @registry.register_at("thing")
+        def new_thing():
+            return Thing()
+
+        with ModelFactory(registry, session, options={"cleanup": "truncate"}) as mm:
+            mm.thing.new(count_=3)
+
+        with ModelFactory(registry, session, options={"cleanup": "truncate"}) as mm:
+            thing = mm.thing.new()
+            assert thing.id == 1
+
+
+class TestRollbackCleanup:
+    def setup(self):
+        registry.clear()
+
+    def test_exit_removal(self):
+        engine = enable_sqlite_savepoints(create_engine("sqlite:///"))
+        Base.metadata.create_all(engine)
+        session = sessionmaker(engine)()
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar(bar2s=[Bar2()])
+
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *_: statements.append(statement),
+        )
+
+        with ModelFactory(registry, session, options={"cleanup": "rollback"}) as mm:
+            mm.bar.new()
+            mm.bar.new(count_=3)
+
+            # The factory's commits only release savepoints.
+            assert len(session.query(Bar).all()) == 4
+            assert len(session.query(Bar2).all()) == 4
+
+        assert not any(statement.startswith("DELETE") for statement in statements)
+
+        assert len(session.query(Bar).all()) == 0
+        assert len(session.query(Bar2).all()) == 0
+
+    def test_invalid_option(self):
+        session = get_session(Base)
+        with pytest.raises(ValueError):
+            ModelFactory(registry, session, options={"cleanup": "wat"})
+
+
+class TestBatchCalls:
+    def setup(self):
+        registry.clear()
+
+    def test_count(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar()
+
+        flushes = []
+        event.listen(session, "after_flush", lambda *_: flushes.append(1))
+
+        with ModelFactory(registry, session) as mm:
+            bars = mm.bar.new(count_=5)
+
+            assert len(bars) == 5
+            assert all(isinstance(bar, Bar) for bar in bars)
+            assert len(flushes) == 1
+            assert len(session.query(Bar).all()) == 5
+
+        assert len(session.query(Bar).all()) == 0
+
+    def test_count_nested_results(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar():
+            return [Bar(), Bar()]
+
+        with ModelFactory(registry, session) as mm:
+            bars = mm.bar.new(count_=3)
+
+            assert len(bars) == 3
+            assert len(session.query(Bar).all()) == 6
+
+    def test_many(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar(id):
+            return Bar(id=id)
+
+        with ModelFactory(registry, session) as mm:
+            bars = mm.bar.new.many([{"id": 4}, {"id": 5}], merge_=True)
+
+            assert [bar.id for bar in bars] == [4, 5]
+            assert len(session.query(Bar).all()) == 2
+
+
+class TestBatchContext:
+    def setup(self):
+        registry.clear()
+
+    def test_single_commit(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+
+        commits = []
+        event.listen(session, "after_commit", lambda *_: commits.append(1))
+
+        with ModelFactory(registry, session) as mm:
+            with mm.batch():
+                bar = mm.bar.new()
+                bars = mm.bar.new(count_=3)
+                assert bar.id is None
+                assert commits == []
+
+            assert len(commits) == 1
+            assert bar.id is not None
+            assert all(b.id for b in bars)
+            assert len(session.query(Bar).all()) == 4
+
+        assert len(session.query(Bar).all()) == 0
+
+    def test_explicit_flush(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+
+        with ModelFactory(registry, session) as mm:
+            with mm.batch():
+                bar = mm.bar.new()
+                with mm.batch():
+                    mm.bar.new()
+
+                assert bar.id is None
+
+                mm.flush()
+                assert bar.id is not None
+
+    def test_exception_discards_pending(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(ValueError):
+                with mm.batch():
+                    mm.bar.new()
+                    raise ValueError()
+
+            assert len(session.query(Bar).all()) == 0
+
+    def test_exception_discards_queued_models(self):
+        session = get_session(Base)
+        registry.register_at("foo")(lambda: Foo(bar=Bar()))
+        registry.register_at("bar")(lambda: Bar())
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(ValueError):
+                with mm.batch():
+                    mm.foo.new(count_=3)
+                    raise ValueError()
+
+            mm.bar.new()
+            assert len(session.query(Foo).all()) == 0
+            assert len(session.query(Bar).all()) == 1
+            assert mm.created_count() == 1
+
+    def test_unbound_namespace(self):
+        registry.register_at("bar")(lambda: Bar())
+        namespace = Namespace.from_registry(registry)
+        with pytest.raises(RuntimeError):
+            namespace.batch()
+
+
+class TestCreated:
+    def setup(self):
+        registry.clear()
+
+    def test_created(self):
+        session = get_session(Base)
+
+        @registry.register_at("baz")
+        def new_baz():
+            return Baz(bar=Bar())
+
+        with ModelFactory(registry, session) as mm:
+            bazs = mm.baz.new(count_=3)
+            with mm.batch():
+                mm.baz.new()
+                session.query(Baz).all()  # autoflush
+                mm.baz.new()
+
+            assert mm.created(Baz)[:3] == bazs
+            assert mm.created_count(Baz) == 5
+            assert mm.created_count(Bar) == 5
+            assert mm.created_count() == 10
+
+            session.add(Bar())
+            session.commit()
+            assert mm.created_count() == 10
+
+
+class TestPrimaryKeyTracking:
+    def setup(self):
+        registry.clear()
+
+    def test_expunge(self):
+        session = get_session(Base)
+
+        @registry.register_at("baz")
+        def new_baz():
+            return Baz(bar=Bar())
+
+        options = {"track": "pk", "expunge": True}
+        with ModelFactory(registry, session, options=options) as mm:
+            bazs = mm.baz.new(count_=3)
+            with mm.batch():
+                mm.baz.new()
+                session.query(Baz).all()  # autoflush
+                mm.baz.new()
+
+            assert len(session.identity_map) == 0
+            assert [baz.id for baz in bazs] == [1, 2, 3]
+
+            assert mm.created(Baz) == [(1,), (2,), (3,), (4,), (5,)]
+            assert mm.created_count(Bar) == 5
+            assert len(session.query(Baz).all()) == 5
+
+        assert len(session.query(Bar).all()) == 0
+        assert len(session.query(Baz).all()) == 0
+
+    def test_invalid_option(self):
+        session = get_session(Base)
+        with pytest.raises(ValueError):
+            ModelFactory(registry, session, options={"track": "wat"})
+
+
+class TestTransactionIsolation:
+    def setup(self):
+        registry.clear()
+
+    def test_no_rollback_between_calls(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+
+        rollbacks = []
+        event.listen(session, "after_soft_rollback", lambda *_: rollbacks.append(1))
+
+        with ModelFactory(registry, session) as mm:
+            mm.bar.new()
+            mm.bar.new()
+            assert rollbacks == []
+
+    def test_isolate_calls(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+
+        rollbacks = []
+        event.listen(session, "after_soft_rollback", lambda *_: rollbacks.append(1))
+
+        with ModelFactory(registry, session, options={"isolate_calls": True}) as mm:
+            session.add(Bar(id=10))
+            mm.bar.new()
+            mm.bar.new()
+            assert len(rollbacks) == 2
+            assert [bar.id for bar in session.query(Bar).all()] == [1, 2]
+
+    def test_recovers_from_failed_flush(self):
+        session = get_session(Base)
+        registry.register_at("foo")(lambda bar=None: Foo(bar=bar))
+
+        with ModelFactory(registry, session) as mm:
+            # A NOT NULL violation is only detected by the database itself.
+            with pytest.raises(IntegrityError):
+                mm.foo.new()
+
+            foo = mm.foo.new(bar=Bar(id=2))
+            assert foo.bar_id == 2
+
+
+class TestRefresh:
+    def setup(self):
+        registry.clear()
+
+    def record_selects(self, session):
+        statements = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *_: statements.append(statement),
+        )
+        return statements
+
+    def selects(self, statements):
+        return [s for s in statements if s.startswith("SELECT")]
+
+    def test_eager(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+        statements = self.record_selects(session)
+
+        with ModelFactory(registry, session) as mm:
+            mm.bar.new(count_=3)
+            assert len(self.selects(statements)) == 3
+
+    def test_batch(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: [Bar(), Baz(bar=Bar())])
+        statements = self.record_selects(session)
+
+        with ModelFactory(registry, session, options={"refresh": "batch"}) as mm:
+            results = mm.bar.new(count_=3)
+            assert len(self.selects(statements)) == 2
+
+            del statements[:]
+            assert all(baz.bar_id for _, baz in results)
+            assert self.selects(statements) == []
+
+    def test_expire(self):
+        session = get_session(Base)
+        registry.register_at("bar", refresh="expire")(lambda: Bar())
+        statements = self.record_selects(session)
+
+        with ModelFactory(registry, session, options={"commit": False}) as mm:
+            bar = mm.bar.new()
+            assert self.selects(statements) == []
+
+            assert bar.id == 1
+            assert len(self.selects(statements)) == 1
+
+    def test_returning(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+        statements = self.record_selects(session)
+
+        with ModelFactory(registry, session) as mm:
+            bar = mm.bar.new(refresh_="returning")
+            assert bar.id == 1
+            assert self.selects(statements) == []
+
+    def test_none(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+        statements = self.record_selects(session)
+
+        with ModelFactory(registry, session) as mm:
+            mm.bar.new(count_=3, refresh_="none")
+            assert self.selects(statements) == []
+
+    def test_invalid(self):
+        session = get_session(Base)
+        registry.register_at("bar")(lambda: Bar())
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(ValueError):
+                mm.bar.new(refresh_="wat")
+
+
+class TestStream:
+    def setup(self):
+        registry.clear()
+
+        @registry.register_at("baz")
+        def new_baz():
+            return Baz(bar=Bar())
+
+    def test_stream(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session, options={"track": "pk"}) as mm:
+            stream = mm.baz.new.stream(7, chunk_size=3)
+            assert mm.created_count() == 0
+
+            bazs = []
+            for baz in stream:
+                bazs.append(baz)
+                assert len(session.identity_map) == 0
+
+            assert [baz.id for baz in bazs] == list(range(1, 8))
+            assert [baz.bar_id for baz in bazs] == list(range(1, 8))
+            assert mm.created_count(Baz) == 7
+            assert mm.created_count(Bar) == 7
+            assert session.query(Baz).count() == 7
+
+        assert session.query(Baz).count() == 0
+        assert session.query(Bar).count() == 0
+
+    def test_object_tracker_releases_models(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session) as mm:
+            refs = [weakref.ref(baz) for baz in mm.baz.new.stream(4, chunk_size=2)]
+            gc.collect()
+
+            assert all(ref() is None for ref in refs)
+            assert mm.created(Baz) == [(1,), (2,), (3,), (4,)]
+            assert mm.created_count() == 8
+
+        assert session.query(Baz).count() == 0
+        assert session.query(Bar).count() == 0
+
+    def test_pks(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session) as mm:
+            pks = list(mm.baz.new.stream(5, chunk_size=2, pks=True))
+            assert pks == [(1,), (2,), (3,), (4,), (5,)]
+
+        assert session.query(Baz).count() == 0
+
+    def test_stops_early(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session) as mm:
+            stream = mm.baz.new.stream(10, chunk_size=2)
+            next(stream)
+            stream.close()
+
+            assert session.query(Baz).count() == 2
+
+    def test_batch_unsupported(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session) as mm:
+            with mm.batch():
+                with pytest.raises(RuntimeError):
+                    mm.baz.new.stream(2)
+
+
+class TestProfile:
+    def setup(self):
+        registry.clear()
+
+        @registry.register_at("baz")
+        def new_baz():
+            return Baz(bar=Bar())
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar()
+
+    def test_stats(self):
+        session = get_session(Base)
+
+        manager = ModelFactory(registry, session, options={"profile": True})
+        with manager as mm:
+            mm.baz.new()
+            mm.baz.new(count_=3)
+            mm.bar.new.many([{}, {}])
+            with mm.batch():
+                mm.bar.new()
+
+            stats = mm.stats()
+
+        baz = stats["baz.new"]
+        assert baz.calls == 2
+        assert baz.flushes == 2
+        assert baz.refreshes == 4
+        assert baz.statements > 0
+        assert 0 < baz.user_time < baz.time
+
+        bar = stats["bar.new"]
+        assert bar.calls == 2
+        assert bar.flushes == 1
+
+        assert stats["<batch>"].flushes == 1
+        assert manager.profiler.cleanup.statements > 0
+
+    def test_disabled(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(RuntimeError):
+                mm.stats()
+
+    def test_memory(self):
+        import tracemalloc
+
+        session = get_session(Base)
+
+        with ModelFactory(registry, session, options={"profile_memory": True}) as mm:
+            bazs = mm.baz.new(count_=50)
+            assert tracemalloc.is_tracing()
+
+            stats = mm.stats()["baz.new"]
+            assert stats.allocated > 0
+            assert stats.blocks > 0
+            del bazs
+
+        assert not tracemalloc.is_tracing()
+
+
+class TestHooks:
+    def setup(self):
+        registry.clear()
+
+        @registry.register_at("baz")
+        def new_baz(name=None):
+            return Baz(bar=Bar())
+
+    def listen_all(self):
+        from sqlalchemy_model_factory.hooks import EVENTS
+
+        events = []
+        for name in EVENTS:
+            registry.listen(name, events.append)
+        return events
+
+    def remove_all(self, events):
+        from sqlalchemy_model_factory.hooks import EVENTS
+
+        for name in EVENTS:
+            registry.remove_listener(name, events.append)
+
+    def test_events(self):
+        session = get_session(Base)
+        events = self.listen_all()
+        try:
+            with ModelFactory(registry, session) as mm:
+                mm.baz.new(count_=2, name="a")
+            names = [event.name for event in events]
+        finally:
+            self.remove_all(events)
+
+        assert names == [
+            "before_call",
+            "after_call",
+            "before_add_result",
+            "before_flush",
+            "after_flush",
+            "before_commit",
+            "after_commit",
+            "before_refresh",
+            "after_refresh",
+            "after_add_result",
+            "before_cleanup",
+            "after_cleanup",
+        ]
+
+        after_call = events[1]
+        assert after_call.path == "baz.new"
+        assert after_call.kwargs == {"name": "a"}
+        assert after_call.size == 2
+        assert after_call.elapsed >= 0
+        assert len(after_call.result) == 2
+
+        assert events[9].path == "baz.new"
+        assert events[9].size == 2
+        assert events[-1].size == 4
+        assert events[-1].path is None
+
+    def test_error(self):
+        session = get_session(Base)
+        events = []
+        registry.listen("after_call", events.append)
+
+        @registry.register_at("baz", name="broken")
+        def broken():
+            raise ValueError()
+
+        try:
+            with ModelFactory(registry, session) as mm:
+                with pytest.raises(ValueError):
+                    mm.baz.broken()
+        finally:
+            registry.remove_listener("after_call", events.append)
+
+        assert isinstance(events[0].error, ValueError)
+
+    def test_inactive(self):
+        session = get_session(Base)
+        events = []
+        registry.listen("after_call", events.append)
+        registry.remove_listener("after_call", events.append)
+
+        assert registry.hooks.active is False
+        with ModelFactory(registry, session) as mm:
+            mm.baz.new()
+        assert events == []
+
+
 class TestNamespaceNesting:
     def setup(self):
         registry.clear()
@@ -239,3 +981,211 @@ def test_merge():
         session.add(Bar2(bar=bar))
         session.commit()
         assert bar.id == 1
+
+
+class TestAutoincrementReset:
+    def setup(self):
+        registry.clear()
+
+    def test_reset_on_exit(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @autoincrement
+        def new_bar(autoincrement=1):
+            return Bar(id=autoincrement)
+
+        for _ in range(2):
+            with ModelFactory(registry, session) as mf:
+                assert [mf.bar.new().id, mf.bar.new().id] == [1, 2]
+
+    def test_no_reset_without_cleanup(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @autoincrement
+        def new_bar(autoincrement=1):
+            return Bar(id=autoincrement)
+
+        with ModelFactory(registry, session, options={"cleanup": False}) as mf:
+            assert mf.bar.new().id == 1
+
+        with ModelFactory(registry, session, options={"cleanup": False}) as mf:
+            assert mf.bar.new().id == 2
+
+    def test_restores_values_upon_entry(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @autoincrement
+        def new_bar(autoincrement=1):
+            return Bar(id=autoincrement)
+
+        with ModelFactory(registry, session, options={"cleanup": False}) as mf:
+            assert [mf.bar.new().id, mf.bar.new().id] == [1, 2]
+
+        for _ in range(2):
+            with ModelFactory(registry, session) as mf:
+                assert mf.bar.new().id == 3
+
+        assert session.query(Bar).count() == 2
+
+    def test_reset_option(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @autoincrement
+        def new_bar(autoincrement=1):
+            return Bar(id=autoincrement)
+
+        options = {"reset_autoincrement": False}
+        with ModelFactory(registry, session, options=options) as mf:
+            assert mf.bar.new().id == 1
+
+        with ModelFactory(registry, session, options=options) as mf:
+            assert mf.bar.new().id == 2
+
+
+class TestCoreInsert:
+    def setup(self):
+        registry.clear()
+
+    def test_core_default(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar()
+
+        @registry.register_at("baz")
+        @for_model(Baz, core=True)
+        def new_baz(bar_id):
+            return {"bar_id": bar_id}
+
+        with ModelFactory(registry, session) as mf:
+            bar = mf.bar.new()
+            identities = mf.baz.new(bar.id, count_=3)
+            identity = mf.baz.new(bar.id)
+
+            assert [id for id, in identities] == [1, 2, 3]
+            assert identity == (4,)
+            assert mf.created_count(Baz) == 4
+            assert session.query(Baz).filter(Baz.bar_id == bar.id).count() == 4
+
+        assert session.query(Baz).count() == 0
+        assert session.query(Bar).count() == 0
+
+    def test_core_call_option(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @for_model(Bar)
+        def new_bar(id=None):
+            return {"id": id} if id else {}
+
+        with ModelFactory(registry, session, options={"track": "pk"}) as mf:
+            assert isinstance(mf.bar.new(), Bar)
+
+            identities = mf.bar.new.many([{"id": 10}, {}, {"id": 12}], core_=True)
+            assert [id for id, in identities] == [10, 13, 12]
+            assert session.query(Bar).count() == 4
+
+        assert session.query(Bar).count() == 0
+
+    def test_core_requires_for_model(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        def new_bar():
+            return Bar()
+
+        with ModelFactory(registry, session) as mf:
+            with pytest.raises(ValueError):
+                mf.bar.new(core_=True)
+
+    def test_core_non_column_attribute(self):
+        session = get_session(Base)
+
+        @registry.register_at("baz")
+        @for_model(Baz, core=True)
+        def new_baz():
+            return {"bar": Bar()}
+
+        with ModelFactory(registry, session) as mf:
+            with pytest.raises(ValueError):
+                mf.baz.new()
+
+    def test_core_batch(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @for_model(Bar, core=True)
+        def new_bar():
+            return {}
+
+        with ModelFactory(registry, session) as mf:
+            with mf.batch():
+                mf.bar.new(count_=2)
+                session.rollback()
+
+            assert session.query(Bar).count() == 0
+
+            with mf.batch():
+                mf.bar.new(count_=2)
+            session.rollback()
+            assert session.query(Bar).count() == 2
+
+    def test_core_profiled(self):
+        session = get_session(Base)
+
+        @registry.register_at("bar")
+        @for_model(Bar, core=True)
+        def new_bar():
+            return {}
+
+        manager = ModelFactory(registry, session, options={"profile": True})
+        with manager as mf:
+            mf.bar.new(count_=5)
+            stats = mf.stats()["bar.new"]
+            assert stats.calls == 1
+            assert stats.flushes == 0
+
+        assert session.query(Bar).count() == 0
+
+    def test_core_single_table_inheritance(self):
+        session = get_session(Base)
+
+        @registry.register_at("dog")
+        @for_model(Dog, core=True)
+        def new_dog():
+            return {}
+
+        with ModelFactory(registry, session) as mf:
+            mf.dog.new(count_=2)
+            assert [dog.kind for dog in session.query(Animal).all()] == ["dog", "dog"]
+
+        assert session.query(Animal).count() == 0
+
+    def test_core_unordered_returning_inserts_per_row(self):
+        session = get_session(Base)
+        dialect = session.get_bind().dialect
+
+        @registry.register_at("bar")
+        @for_model(Bar, core=True)
+        def new_bar(id=None):
+            return {"id": id}
+
+        statements = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *_: statements.append(statement),
+        )
+
+        attr = "insert_executemany_returning_sort_by_parameter_order"
+        with mock.patch.object(dialect, attr, False, create=True):
+            with ModelFactory(registry, session) as mf:
+                identities = mf.bar.new.many([{"id": 7}, {"id": 3}, {"id": 5}])
+                assert identities == [(7,), (3,), (5,)]
+
+        assert sum(s.startswith("INSERT") for s in statements) == 3
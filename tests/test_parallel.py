@@ -0,0 +1,191 @@
+import pytest
+from sqlalchemy import Column, create_engine, event, ForeignKey, types
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy_model_factory.base import ModelFactory
+from sqlalchemy_model_factory.registry import registry
+from sqlalchemy_model_factory.utils import for_model
+from tests import get_session
+
+Base = declarative_base()
+
+
+class Foo(Base):
+    __tablename__ = "foo"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    bar_id = Column(types.Integer(), ForeignKey("bar.id"), nullable=False)
+
+    bar = relationship("Bar", uselist=False)
+
+
+class Bar(Base):
+    __tablename__ = "bar"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+    name = Column(types.Unicode(), nullable=True, unique=True)
+
+
+def file_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    return get_session(Base, session=sessionmaker(engine)())
+
+
+class TestParallel:
+    def setup(self):
+        registry.clear()
+
+        @registry.register_at("foo")
+        def new_foo(bar=None):
+            return Foo(bar=bar or Bar())
+
+        @registry.register_at("bar")
+        def new_bar(name=None):
+            return Bar(name=name)
+
+    def test_parallel(self, tmp_path):
+        session = file_session(tmp_path)
+
+        with ModelFactory(registry, session) as mm:
+            foos = mm.parallel(workers=4, chunk_size=10).foo.new(count_=95)
+
+            assert len(foos) == 95
+            assert len({foo.id for foo in foos}) == 95
+            assert mm.created_count(Foo) == 95
+            assert mm.created_count(Bar) == 95
+            assert session.query(Foo).count() == 95
+
+            foo = mm.parallel(workers=2).foo.new()
+            assert foo.id == 96
+
+        assert session.query(Foo).count() == 0
+        assert session.query(Bar).count() == 0
+
+    def test_pk_tracking(self, tmp_path):
+        session = file_session(tmp_path)
+
+        with ModelFactory(registry, session, options={"track": "pk"}) as mm:
+            mm.parallel(workers=3, chunk_size=7).bar.new(count_=20)
+            assert sorted(mm.created(Bar)) == [(i,) for i in range(1, 21)]
+
+        assert session.query(Bar).count() == 0
+
+    def test_merge_parent_arguments(self, tmp_path):
+        session = file_session(tmp_path)
+
+        with ModelFactory(registry, session) as mm:
+            bar = mm.bar.new()
+            foos = mm.parallel(workers=2, chunk_size=5).foo.new(
+                bar=bar, count_=10, merge_=True
+            )
+            assert {foo.bar_id for foo in foos} == {bar.id}
+            assert mm.created_count(Bar) == 1
+
+        assert session.query(Foo).count() == 0
+        assert session.query(Bar).count() == 0
+
+    def test_failed_chunk_is_raised(self, tmp_path):
+        session = file_session(tmp_path)
+
+        with ModelFactory(registry, session) as mm:
+            parallel = mm.parallel(workers=2, chunk_size=1)
+            with pytest.raises(Exception):
+                parallel.bar.new.many([{"name": "a"}, {"name": "b"}, {"name": "a"}])
+
+            assert session.query(Bar).count() == 2
+            assert mm.created_count(Bar) == 2
+
+        assert session.query(Bar).count() == 0
+
+    def test_rollback_cleanup_unsupported(self):
+        session = get_session(Base)
+
+        with ModelFactory(registry, session, options={"cleanup": "rollback"}) as mm:
+            with pytest.raises(ValueError):
+                mm.parallel(workers=2)
+
+    def test_batch_unsupported(self, tmp_path):
+        session = file_session(tmp_path)
+
+        with ModelFactory(registry, session) as mm:
+            with mm.batch():
+                with pytest.raises(RuntimeError):
+                    mm.parallel(workers=2).bar.new()
+
+    def test_single_connection_unsupported(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        session = get_session(Base, session=sessionmaker(engine)())
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(ValueError):
+                mm.parallel(workers=2)
+
+    def test_deferred_commit_unsupported(self, tmp_path):
+        session = file_session(tmp_path)
+
+        with ModelFactory(registry, session, options={"commit": False}) as mm:
+            with pytest.raises(ValueError):
+                mm.parallel(workers=2)
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(ValueError):
+                mm.parallel(workers=2).bar.new(commit_=False)
+
+            with pytest.raises(ValueError):
+                mm.parallel(workers=2).bar.new(refresh_="expire")
+
+    @pytest.mark.parametrize(
+        "refresh, selects", [("eager", 6), ("batch", 3), ("none", 0)]
+    )
+    def test_refresh(self, tmp_path, refresh, selects):
+        session = file_session(tmp_path)
+        statements = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *_: statements.append(statement),
+        )
+
+        with ModelFactory(registry, session) as mm:
+            bars = mm.parallel(workers=3, chunk_size=2).bar.new(
+                count_=6, refresh_=refresh
+            )
+            assert len(bars) == 6
+            assert sum(s.startswith("SELECT") for s in statements) == selects
+
+    def test_core_unsupported(self, tmp_path):
+        session = file_session(tmp_path)
+
+        @registry.register_at("bar", name="core")
+        @for_model(Bar, core=True)
+        def new_core_bar():
+            return {}
+
+        with ModelFactory(registry, session) as mm:
+            with pytest.raises(TypeError):
+                mm.parallel(workers=2).bar.core()
+
+    def test_profile_and_hooks(self, tmp_path):
+        session = file_session(tmp_path)
+        events = []
+        registry.listen("after_call", events.append)
+        registry.listen("after_add_result", events.append)
+
+        try:
+            with ModelFactory(registry, session, options={"profile": True}) as mm:
+                parallel = mm.parallel(workers=2, chunk_size=5)
+                parallel.bar.new(count_=10)
+
+                assert mm.stats()["bar.new"].calls == 1
+                assert parallel.stats()["bar.new"].calls == 1
+                assert [(event.name, event.size) for event in events] == [
+                    ("after_call", 10),
+                    ("after_add_result", 10),
+                ]
+
+                with pytest.raises(TypeError):
+                    parallel.bar.new.stream(10)
+        finally:
+            registry.remove_listener("after_call", events.append)
+            registry.remove_listener("after_add_result", events.append)
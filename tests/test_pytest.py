@@ -34,3 +34,55 @@ def mf_session():
 def test_mf_fixture(mf):
     foo = mf.foo.new()
     assert foo.id == 1
+
+
+class FakeTerminalReporter:
+    def __init__(self):
+        self.lines = []
+
+    def write_sep(self, sep, title):
+        self.lines.append(title)
+
+    def write_line(self, line, **markup):
+        self.lines.append(line)
+
+
+def test_profile_report():
+    from sqlalchemy_model_factory.base import ModelFactory
+    from sqlalchemy_model_factory.pytest import ProfileReport
+
+    report = ProfileReport()
+    for nodeid in ("test_a", "test_b"):
+        manager = ModelFactory(registry, get_session(Base), options={"profile": True})
+        with manager as mf:
+            mf.foo.new()
+        report.add(nodeid, manager.profiler)
+
+    assert report.factories["foo.new"].calls == 2
+
+    terminal = FakeTerminalReporter()
+    report.write(terminal)
+    assert terminal.lines[0] == "model factory profile"
+    assert any(line.startswith("foo.new ") for line in terminal.lines)
+    assert any(line.startswith("test_b ") for line in terminal.lines)
+
+
+def test_profile_report_memory_budget():
+    from sqlalchemy_model_factory.base import ModelFactory
+    from sqlalchemy_model_factory.pytest import ProfileReport
+
+    report = ProfileReport(memory=True, budget=1)
+    manager = ModelFactory(
+        registry, get_session(Base), options={"profile_memory": True}
+    )
+    with manager as mf:
+        foos = mf.foo.new(count_=100)
+    report.add("test_big", manager.profiler)
+    del foos
+
+    assert [nodeid for nodeid, _ in report.over_budget()] == ["test_big"]
+
+    terminal = FakeTerminalReporter()
+    report.write(terminal)
+    assert "allocated" in terminal.lines[1]
+    assert any("memory budget" in line for line in terminal.lines)
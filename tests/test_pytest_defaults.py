@@ -0,0 +1,72 @@
+import os
+
+import pytest
+from sqlalchemy import Column, event, types
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy_model_factory.pytest import create_schema, provision_database
+from sqlalchemy_model_factory.registry import Registry
+
+Base = declarative_base()
+
+
+class Foo(Base):
+    __tablename__ = "defaults_foo"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+
+
+registry = Registry()
+
+
+@registry.register_at("foo")
+def new_foo():
+    return Foo()
+
+
+@pytest.fixture
+def mf_registry():
+    return registry
+
+
+@pytest.fixture
+def mf_metadata():
+    return Base.metadata
+
+
+@pytest.fixture
+def mf_config():
+    return {"cleanup": "rollback"}
+
+
+@pytest.mark.parametrize("attempt", [1, 2])
+def test_shared_engine_isolation(mf, mf_session, attempt):
+    mf.foo.new(count_=3)
+    assert mf_session.query(Foo).count() == 3
+
+
+def test_schema_created_once(mf_engine):
+    create_schema(mf_engine, Base.metadata)
+
+    statements = []
+
+    def record(conn, cursor, statement, *_):
+        statements.append(statement)
+
+    event.listen(mf_engine, "before_cursor_execute", record)
+    try:
+        create_schema(mf_engine, Base.metadata)
+    finally:
+        event.remove(mf_engine, "before_cursor_execute", record)
+
+    assert statements == []
+
+
+def test_worker_database_url(mf_database_url, mf_worker_id):
+    assert mf_worker_id == os.environ.get("PYTEST_XDIST_WORKER", "master")
+    assert mf_database_url == "sqlite://"
+
+
+def test_provision_sqlite_database(tmp_path):
+    path = tmp_path / "gw1" / "test.sqlite"
+    provision_database(f"sqlite:///{path}")
+    assert path.parent.is_dir()
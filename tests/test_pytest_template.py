@@ -0,0 +1,78 @@
+import os
+
+import pytest
+from sqlalchemy import Column, types
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy_model_factory.pytest import (
+    create_template_engine_fixture,
+    SqliteTemplate,
+)
+from sqlalchemy_model_factory.registry import Registry
+
+Base = declarative_base()
+
+
+class Foo(Base):
+    __tablename__ = "template_foo"
+
+    id = Column(types.Integer(), autoincrement=True, primary_key=True)
+
+
+registry = Registry()
+
+
+@registry.register_at("foo")
+def new_foo():
+    return Foo()
+
+
+def seed(session):
+    session.add_all([Foo(), Foo()])
+
+
+mf_engine = create_template_engine_fixture(Base.metadata, seed=seed)
+
+
+@pytest.fixture
+def mf_registry():
+    return registry
+
+
+@pytest.fixture
+def mf_config():
+    return {"cleanup": False}
+
+
+@pytest.mark.parametrize("attempt", [1, 2])
+def test_fresh_copy_per_test(mf, mf_session, attempt):
+    assert mf_session.query(Foo).count() == 2
+
+    mf.foo.new(count_=3)
+    assert mf_session.query(Foo).count() == 5
+
+
+def test_on_disk(tmp_path):
+    template = SqliteTemplate(Base.metadata, seed=seed, on_disk=True)
+    table = Foo.__table__
+
+    engine1 = template.clone(str(tmp_path / "1"))
+    with engine1.begin() as conn:
+        conn.execute(table.insert())
+        assert len(conn.execute(table.select()).fetchall()) == 3
+    engine1.dispose()
+
+    engine2 = template.clone(str(tmp_path / "2"))
+    with engine2.begin() as conn:
+        assert len(conn.execute(table.select()).fetchall()) == 2
+    engine2.dispose()
+
+
+def test_close_removes_template(tmp_path):
+    template = SqliteTemplate(Base.metadata, seed=seed, on_disk=True)
+    template.clone(str(tmp_path)).dispose()
+
+    path = template._path
+    assert os.path.exists(path)
+
+    template.close()
+    assert not os.path.exists(os.path.dirname(path))
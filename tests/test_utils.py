@@ -1,5 +1,13 @@
+import concurrent.futures
+import os
+from unittest import mock
+
 import pytest
-from sqlalchemy_model_factory.utils import fluent
+from sqlalchemy_model_factory.utils import (
+    autoincrement,
+    AutoincrementSequence,
+    fluent,
+)
 
 
 class Test_fluent:
@@ -53,3 +61,105 @@ class Test_fluent:
         result = fluent(foo).bar(4).bind(call_after=print)
         assert result == 4
         assert capsys.readouterr().out == "4\n"
+
+    def test_plan_cached_on_function(self):
+        def foo(bar, baz=2):
+            return (bar, baz)
+
+        assert fluent(foo).bar(1).bind() == (1, 2)
+        plan = foo._fluent_plan
+        assert fluent(foo).bar(3).baz(4).bind() == (3, 4)
+        assert foo._fluent_plan is plan
+
+    def test_plan_not_shared_with_wrapper(self):
+        import functools
+
+        def foo(bar):
+            return bar
+
+        fluent(foo)
+
+        @functools.wraps(foo)
+        def wrapper(*args, **kwargs):
+            return foo(*args, **kwargs) + 1
+
+        assert fluent(wrapper).bar(1).bind() == 2
+
+    def test_shared_prefix(self):
+        def foo(bar, baz, *args, bay=3, **kwargs):
+            return (bar, baz, args, bay, kwargs)
+
+        partial = fluent(foo).bar(1)
+        assert partial.baz(2).bind() == (1, 2, (), 3, {})
+        assert partial.baz(baz=5).args(6, 7).bay(bay=8).kwargs(a=9).bind() == (
+            1,
+            5,
+            (6, 7),
+            8,
+            {"a": 9},
+        )
+        assert partial.pending_args == {"bar": {"bar": 1}}
+
+    def test_invalid_setter_arguments(self):
+        def foo(bar, *, baz=1):
+            return bar
+
+        with pytest.raises(TypeError):
+            fluent(foo).bar(1, 2)
+
+        with pytest.raises(TypeError):
+            fluent(foo).baz(2)
+
+        with pytest.raises(TypeError):
+            fluent(foo).baz(baz=2).bind()
+
+    def test_pending_args(self):
+        def foo(a, b=2, c=3):
+            return (a, b, c)
+
+        original = fluent(foo).a(1).c(5)
+        copy = fluent(foo, original.signature, original.pending_args)
+
+        assert copy.pending_args == {"a": {"a": 1}, "c": {"c": 5}}
+        assert copy.bind() == (1, 2, 5)
+        assert copy.b(4).bind() == (1, 4, 5)
+
+        single = fluent(foo, original.signature, {"a": {"a": 9}})
+        assert single.bind() == (9, 2, 3)
+
+
+class Test_autoincrement:
+    def test_threads_unique(self):
+        @autoincrement
+        def new(autoincrement=1):
+            return autoincrement
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            values = list(pool.map(lambda _: new(), range(10000)))
+
+        assert sorted(values) == list(range(1, 10001))
+
+    def test_allocator_threads_unique(self):
+        blocks = iter(range(1, 100000, 10))
+        sequence = AutoincrementSequence(
+            block_size=10, allocator=lambda _: next(blocks)
+        )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            values = list(pool.map(lambda _: next(sequence), range(1000)))
+
+        assert sorted(values) == list(range(1, 1001))
+
+    def test_worker_partitions(self):
+        def first_value(worker):
+            with mock.patch.dict(os.environ, {"PYTEST_XDIST_WORKER": worker}):
+
+                @autoincrement(partition_size=1000)
+                def new(autoincrement=1):
+                    return autoincrement
+
+            return new(), new()
+
+        assert first_value("gw0") == (1, 2)
+        assert first_value("gw1") == (1001, 1002)
+        assert first_value("gw7") == (7001, 7002)